@@ -9,69 +9,89 @@ Usage:
     python budgetguard_techops.py gui          # Launch GUI
     python budgetguard_techops.py deploy ...   # Command line deployment
     python budgetguard_techops.py install-credentials ...  # Install credentials
+
+Note for contributors: keep module-level imports limited to the stdlib
+(argparse, sys, logging, pathlib, ...). Anything heavy — the GUI stack,
+cloud SDKs, cryptography, tools/* helpers — must be imported inside the
+command branch that uses it, so that every other command (and --help)
+starts fast.
 """
 
 import sys
 import argparse
+import functools
 import logging
 from pathlib import Path
 
-# Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 try:
-    from gui.main_window import BudgetGuardTechOpsGUI
-    from config.config_manager import ConfigManager
     from utils.logger import setup_logging
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure all dependencies are installed: pip install -r requirements.txt")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
 
-def main():
-    """Main entry point for BudgetGuard TechOps"""
-    parser = argparse.ArgumentParser(
-        description='BudgetGuard TechOps - NIM Deployment Automation',
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # GUI command
-    gui_parser = subparsers.add_parser('gui', help='Launch the GUI application')
-    
-    # Deploy command
+
+@functools.lru_cache(maxsize=1)
+def _get_config_manager():
+    """Build the ConfigManager at most once per process, importing it lazily"""
+    from config.config_manager import ConfigManager
+    return ConfigManager()
+
+
+def _node_list(value):
+    """argparse type= callable: split a comma-separated node list and strip whitespace"""
+    return [node.strip() for node in value.split(',') if node.strip()]
+
+
+def _build_gui_parser(subparsers):
+    """Build the 'gui' subparser"""
+    subparsers.add_parser('gui', help='Launch the GUI application')
+
+
+def _build_deploy_parser(subparsers):
+    """Build the 'deploy' subparser"""
     deploy_parser = subparsers.add_parser('deploy', help='Deploy NIM instances')
-    deploy_parser.add_argument('--provider', choices=['aws', 'azure', 'gcp', 'all'], 
+    deploy_parser.add_argument('--provider', choices=['aws', 'azure', 'gcp', 'all'],
                                help='Cloud provider to deploy to')
-    deploy_parser.add_argument('--nodes', type=str,
+    deploy_parser.add_argument('--nodes', type=_node_list,
                                help='Comma-separated list of nodes (e.g., "FLUX Dev,FLUX Canny")')
     deploy_parser.add_argument('--region', type=str, default='us-east-1',
                                help='Region for deployment')
-    
-    # Install credentials command
-    install_parser = subparsers.add_parser('install-credentials', 
+
+
+def _build_install_credentials_parser(subparsers):
+    """Build the 'install-credentials' subparser"""
+    install_parser = subparsers.add_parser('install-credentials',
                                           help='Install credentials to ComfyUI')
     install_parser.add_argument('--comfyui-path', type=str, required=True,
                                help='Path to ComfyUI installation')
     install_parser.add_argument('--workstation', type=str,
                                help='Workstation identifier')
-    
-    # Export endpoints command
+
+
+def _build_export_parser(subparsers):
+    """Build the 'export' subparser"""
     export_parser = subparsers.add_parser('export', help='Export endpoint configuration')
     export_parser.add_argument('--output', type=str, default='endpoints.json',
                                help='Output file path')
-    
-    # List deployments command
-    list_parser = subparsers.add_parser('list', help='List all deployments')
-    
-    # Create install package command
-    package_parser = subparsers.add_parser('create-install-package', 
+    export_parser.add_argument('--pretty', action='store_true',
+                               help='Pretty-print the exported JSON (indent=2)')
+
+
+def _build_list_parser(subparsers):
+    """Build the 'list' subparser"""
+    subparsers.add_parser('list', help='List all deployments')
+
+
+def _build_create_install_package_parser(subparsers):
+    """Build the 'create-install-package' subparser"""
+    package_parser = subparsers.add_parser('create-install-package',
                                           help='Create local install package for NIM nodes')
     package_parser.add_argument(
         '--nodes',
-        type=str,
+        type=_node_list,
         required=True,
         help='Comma-separated list of NIM node types (e.g., "FLUX Dev,FLUX Canny")'
     )
@@ -86,8 +106,10 @@ def main():
         type=Path,
         help='Temporary directory for building package (optional)'
     )
-    
-    # Install package command
+
+
+def _build_install_package_parser(subparsers):
+    """Build the 'install-package' subparser"""
     install_pkg_parser = subparsers.add_parser('install-package',
                                                help='Install local install package on workstation')
     install_pkg_parser.add_argument(
@@ -106,63 +128,194 @@ def main():
         action='store_true',
         help='Keep extracted files after installation (for debugging)'
     )
-    
-    args = parser.parse_args()
-    
-    # Setup logging
+
+
+# Map of subcommand name -> parser builder, so we only pay for the
+# add_parser/add_argument calls of the command actually being run
+SUBCOMMANDS = {
+    'gui': _build_gui_parser,
+    'deploy': _build_deploy_parser,
+    'install-credentials': _build_install_credentials_parser,
+    'export': _build_export_parser,
+    'list': _build_list_parser,
+    'create-install-package': _build_create_install_package_parser,
+    'install-package': _build_install_package_parser,
+}
+
+
+# Commands that actually need a ConfigManager (credentials/config access)
+CONFIG_COMMANDS = {'gui', 'deploy', 'install-credentials', 'export'}
+
+
+def _sniff_subcommand(argv):
+    """Peek at argv for the first non-flag token (the subcommand, if any)"""
+    for token in argv:
+        if not token.startswith('-'):
+            return token
+    return None
+
+
+def main():
+    """Main entry point for BudgetGuard TechOps"""
+    # Setup logging before anything that may log
     setup_logging()
-    logger = logging.getLogger(__name__)
-    
-    # Initialize config manager
-    config_manager = ConfigManager()
-    
-    # Handle commands
-    if args.command == 'gui' or args.command is None:
-        # Launch GUI
-        logger.info("Launching BudgetGuard TechOps GUI...")
-        app = BudgetGuardTechOpsGUI(config_manager)
-        app.run()
-    elif args.command == 'deploy':
-        logger.info(f"Deploy command: provider={args.provider}, nodes={args.nodes}")
-        # TODO: Implement deployment logic
-        print("Deployment functionality not yet implemented")
-    elif args.command == 'install-credentials':
-        logger.info(f"Installing credentials to: {args.comfyui_path}")
-        # TODO: Implement credential installation
-        print("Credential installation not yet implemented")
-    elif args.command == 'export':
-        logger.info(f"Exporting endpoints to: {args.output}")
-        # TODO: Implement export logic
-        print("Export functionality not yet implemented")
-    elif args.command == 'list':
-        logger.info("Listing deployments...")
-        # TODO: Implement list logic
-        print("List functionality not yet implemented")
-    elif args.command == 'create-install-package':
-        logger.info(f"Creating install package: nodes={args.nodes}, output={args.output}")
-        from tools.create_install_package import create_install_package
-        node_types = [node.strip() for node in args.nodes.split(',')]
-        success = create_install_package(node_types, args.output, args.temp_dir)
-        if success:
-            print(f"✓ Successfully created install package: {args.output}")
-        else:
-            print(f"✗ Failed to create install package")
-            sys.exit(1)
-    elif args.command == 'install-package':
-        logger.info(f"Installing package: {args.package}")
-        from tools.install_package import install_package
-        success = install_package(
-            args.package,
-            compose_dir=args.compose_dir,
-            keep_extracted=args.keep_extracted
-        )
-        if success:
-            print(f"✓ Successfully installed package")
-        else:
-            print(f"✗ Failed to install package")
-            sys.exit(1)
+
+    parser = argparse.ArgumentParser(
+        description='BudgetGuard TechOps - NIM Deployment Automation',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    # Lazily build only the subparser for the command being invoked.
+    # For --help (or an unrecognized token) build all of them, so the
+    # full command list and argparse's "invalid choice" error still work.
+    command = _sniff_subcommand(sys.argv[1:])
+    if command in SUBCOMMANDS:
+        SUBCOMMANDS[command](subparsers)
     else:
-        parser.print_help()
+        for builder in SUBCOMMANDS.values():
+            builder(subparsers)
+
+    args = parser.parse_args()
+
+    # Initialize config manager - only for commands that touch
+    # credentials/config, so the rest skip the key-file I/O and crypto init
+    command = args.command or 'gui'
+    config_manager = _get_config_manager() if command in CONFIG_COMMANDS else None
+
+    # Handle commands - O(1) dict dispatch, each handler owns its imports
+    HANDLERS[command](args, config_manager, logger)
+
+
+def _handle_gui(args, config_manager, logger):
+    """Launch the GUI (imported here so non-GUI commands skip the Tk stack)"""
+    logger.info("Launching BudgetGuard TechOps GUI...")
+    from gui.main_window import BudgetGuardTechOpsGUI
+    app = BudgetGuardTechOpsGUI(config_manager)
+    app.run()
+
+
+# Tracks in-flight (provider, region) deploys so a double invocation
+# can't launch duplicate infrastructure
+_active_deploys = set()
+_active_deploys_lock = None  # created lazily alongside the executor
+
+
+def _handle_deploy(args, config_manager, logger):
+    logger.info(f"Deploy command: provider={args.provider}, nodes={args.nodes}")
+    if not args.provider or not args.nodes:
+        print("deploy requires --provider and --nodes")
+        sys.exit(1)
+
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from gui.tabs.deployment_handlers import deploy_to_aws, deploy_to_azure, deploy_to_gcp
+
+    global _active_deploys_lock
+    if _active_deploys_lock is None:
+        _active_deploys_lock = threading.Lock()
+
+    deploy_funcs = {
+        'aws': deploy_to_aws,
+        'azure': deploy_to_azure,
+        'gcp': deploy_to_gcp,
+    }
+    providers = list(deploy_funcs) if args.provider == 'all' else [args.provider]
+    node_types = args.nodes
+
+    def _deploy_provider(provider):
+        key = (provider, args.region)
+        with _active_deploys_lock:
+            if key in _active_deploys:
+                raise RuntimeError(f"A {provider} deployment in {args.region} is already in progress")
+            _active_deploys.add(key)
+        try:
+            return [deploy_funcs[provider](node_type, None, config_manager)
+                    for node_type in node_types]
+        finally:
+            with _active_deploys_lock:
+                _active_deploys.discard(key)
+
+    # Dispatch providers concurrently - wall clock is the slowest provider
+    # instead of the sum, and one provider's failure doesn't mask another's
+    # success
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+        futures = {provider: executor.submit(_deploy_provider, provider)
+                   for provider in providers}
+        for provider, future in futures.items():
+            try:
+                results = future.result()
+                print(f"✓ {provider}: deployed {len(results)} node(s)")
+                for result in results:
+                    if result and result.get('endpoint'):
+                        print(f"    {result.get('node_type', '?')}: {result['endpoint']}")
+            except Exception as e:
+                logger.error(f"{provider} deployment failed: {e}", exc_info=True)
+                print(f"✗ {provider}: {e}")
+                failed = True
+    if failed:
+        sys.exit(1)
+
+
+def _handle_install_credentials(args, config_manager, logger):
+    logger.info(f"Installing credentials to: {args.comfyui_path}")
+    # TODO: Implement credential installation
+    print("Credential installation not yet implemented")
+
+
+def _handle_export(args, config_manager, logger):
+    logger.info(f"Exporting endpoints to: {args.output}")
+    import json
+    endpoints = config_manager.load_endpoints()
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(endpoints, f, indent=2 if args.pretty else None)
+    print(f"✓ Exported {len(endpoints)} endpoint(s) to {args.output}")
+
+
+def _handle_list(args, config_manager, logger):
+    logger.info("Listing deployments...")
+    # TODO: Implement list logic
+    print("List functionality not yet implemented")
+
+
+def _handle_create_install_package(args, config_manager, logger):
+    logger.info(f"Creating install package: nodes={args.nodes}, output={args.output}")
+    from tools.create_install_package import create_install_package
+    success = create_install_package(args.nodes, args.output, args.temp_dir)
+    if success:
+        print(f"✓ Successfully created install package: {args.output}")
+    else:
+        print(f"✗ Failed to create install package")
+        sys.exit(1)
+
+
+def _handle_install_package(args, config_manager, logger):
+    logger.info(f"Installing package: {args.package}")
+    from tools.install_package import install_package
+    success = install_package(
+        args.package,
+        compose_dir=args.compose_dir,
+        keep_extracted=args.keep_extracted
+    )
+    if success:
+        print(f"✓ Successfully installed package")
+    else:
+        print(f"✗ Failed to install package")
+        sys.exit(1)
+
+
+# Command dispatch table; keys mirror SUBCOMMANDS above
+HANDLERS = {
+    'gui': _handle_gui,
+    'deploy': _handle_deploy,
+    'install-credentials': _handle_install_credentials,
+    'export': _handle_export,
+    'list': _handle_list,
+    'create-install-package': _handle_create_install_package,
+    'install-package': _handle_install_package,
+}
 
 
 if __name__ == '__main__':
@@ -7,18 +7,141 @@ Handles:
 - Endpoint storage
 """
 
+import copy
 import json
 import os
+import threading
 from pathlib import Path
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 import base64
 import logging
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps_bytes(data, indent=False):
+    """Serialize data to JSON bytes (orjson when available, stdlib otherwise)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+
+def _loads_bytes(data):
+    """Parse JSON bytes (orjson when available, stdlib otherwise)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode())
+
+# Guards the key/cipher caches below; the GUI may build ConfigManagers
+# from a worker thread
+_key_cache_lock = threading.Lock()
+
+# Module-level caches so per-instance init on the hot path is at most one
+# read_bytes() (first instance) or two dict lookups (every one after)
+_KEY_CACHE = {}     # str(config_dir) -> base64 key bytes
+_FERNET_CACHE = {}  # key bytes -> Fernet
+_AESGCM_CACHE = {}  # key bytes -> AESGCM
+
+# Credentials file layout: 1 version byte + 12-byte nonce + AES-GCM
+# ciphertext. Files without a known version byte are legacy Fernet blobs.
+_CREDS_VERSION_AESGCM = b'\x01'
+_CREDS_AAD = b'budgetguard-creds-v1'
+
+
+def _atomic_write_bytes(path, data):
+    """Write bytes to path atomically (temp file + fsync + os.replace)"""
+    tmp_path = path.with_name(path.name + '.tmp.' + str(os.getpid()))
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _load_or_create_key(config_dir):
+    """
+    Load (or derive on first run) the encryption key for a config directory.
+
+    Cached per directory so repeated ConfigManager instantiations in the
+    same process skip the file read and KDF setup. Callers must hold
+    _key_cache_lock.
+
+    Args:
+        config_dir: Config directory as a string (cache key)
+
+    Returns:
+        The base64-encoded Fernet key bytes
+    """
+    encryption_key = _KEY_CACHE.get(config_dir)
+    if encryption_key is not None:
+        return encryption_key
+
+    key_file = Path(config_dir) / ".encryption_key"
+    salt_file = Path(config_dir) / ".encryption_salt"
+
+    if key_file.exists():
+        # Load existing key - the common (hot) path, no KDF involved
+        encryption_key = key_file.read_bytes()
+        _KEY_CACHE[config_dir] = encryption_key
+        return encryption_key
+
+    # Generate new key (one-time cost)
+    # Use a memory-hard password-based key derivation (in production, use a secure password)
+    password = b"budgetguard_techops_default_key"  # TODO: Allow custom password
+    salt = os.urandom(16)
+    kdf = Scrypt(salt=salt, length=32, n=2**15, r=8, p=1)
+    # The urlsafe-b64 wrap is the key's storage format, not an avoidable
+    # intermediate: Fernet only accepts keys in this encoding (still
+    # needed to decrypt legacy credential files), and _aead_for decodes
+    # the same bytes for AES-GCM. Persisting the raw KDF output instead
+    # would orphan every existing .encryption_key file.
+    encryption_key = base64.urlsafe_b64encode(kdf.derive(password))
+
+    # Persist the salt so the key can be re-derived if needed
+    _atomic_write_bytes(salt_file, salt)
+    salt_file.chmod(0o600)  # Restrict permissions (Unix/Linux)
+
+    # Save key (in production, this should be more secure)
+    _atomic_write_bytes(key_file, encryption_key)
+    key_file.chmod(0o600)  # Restrict permissions (Unix/Linux)
+
+    _KEY_CACHE[config_dir] = encryption_key
+    return encryption_key
+
+
+def _cipher_for(key):
+    """Build (and cache) the Fernet cipher for a key. Callers must hold _key_cache_lock."""
+    cipher = _FERNET_CACHE.get(key)
+    if cipher is None:
+        cipher = _FERNET_CACHE[key] = Fernet(key)
+    return cipher
+
+
+def _aead_for(key):
+    """
+    Build (and cache) the AES-GCM cipher for a base64-encoded key.
+
+    AES-GCM is a single-pass AEAD that uses AES-NI where available,
+    unlike Fernet's AES-CBC + HMAC-SHA256 two-pass scheme. Callers must
+    hold _key_cache_lock.
+    """
+    aead = _AESGCM_CACHE.get(key)
+    if aead is None:
+        aead = _AESGCM_CACHE[key] = AESGCM(base64.urlsafe_b64decode(key))
+    return aead
+
+
 class ConfigManager:
     """Manages configuration and credentials for BudgetGuard TechOps"""
     
@@ -40,37 +163,41 @@ class ConfigManager:
         self.credentials_file = self.config_dir / "credentials.encrypted"
         self.config_file = self.config_dir / "config.json"
         self.endpoints_file = self.config_dir / "endpoints.json"
-        
+
+        # In-memory caches, invalidated by file mtime so external edits
+        # are still picked up
+        self._endpoints_cache = None
+        self._endpoints_mtime = 0
+        self._config_cache = None
+        self._config_mtime = 0
+
         # Initialize encryption key
         self._init_encryption_key()
-    
+
+    def _atomic_write_bytes(self, path, data):
+        """
+        Write bytes to path atomically (temp file + fsync + os.replace)
+
+        A crash mid-write can no longer leave a truncated credentials or
+        endpoints file, and concurrent readers never see partial state.
+        """
+        _atomic_write_bytes(path, data)
+
     def _init_encryption_key(self):
-        """Initialize or load encryption key"""
-        key_file = self.config_dir / ".encryption_key"
-        
-        if key_file.exists():
-            # Load existing key
-            with open(key_file, 'rb') as f:
-                self.encryption_key = f.read()
-        else:
-            # Generate new key
-            # Use a password-based key derivation (in production, use a secure password)
-            password = b"budgetguard_techops_default_key"  # TODO: Allow custom password
-            salt = os.urandom(16)
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            self.encryption_key = base64.urlsafe_b64encode(kdf.derive(password))
-            
-            # Save key (in production, this should be more secure)
-            with open(key_file, 'wb') as f:
-                f.write(self.encryption_key)
-            key_file.chmod(0o600)  # Restrict permissions (Unix/Linux)
-        
-        self.cipher = Fernet(self.encryption_key)
+        """Initialize or load encryption key (cached across instances)"""
+        with _key_cache_lock:
+            self.encryption_key = _load_or_create_key(str(self.config_dir))
+            # Fernet is kept for decrypting legacy credential files
+            self.cipher = _cipher_for(self.encryption_key)
+            self.aead = _aead_for(self.encryption_key)
+
+    @staticmethod
+    def invalidate_cache():
+        """Drop the cached keys/ciphers (e.g. after a key rotation)"""
+        with _key_cache_lock:
+            _KEY_CACHE.clear()
+            _FERNET_CACHE.clear()
+            _AESGCM_CACHE.clear()
     
     def save_credentials(self, credentials):
         """
@@ -80,16 +207,14 @@ class ConfigManager:
             credentials: Dictionary of provider -> credential fields
         """
         try:
-            # Convert to JSON string
-            credentials_json = json.dumps(credentials)
-            
-            # Encrypt
-            encrypted_data = self.cipher.encrypt(credentials_json.encode())
-            
-            # Save to file
-            with open(self.credentials_file, 'wb') as f:
-                f.write(encrypted_data)
-            
+            # Serialize straight to bytes and encrypt with AES-GCM
+            nonce = os.urandom(12)
+            ciphertext = self.aead.encrypt(nonce, _dumps_bytes(credentials), _CREDS_AAD)
+
+            # Save to file (version byte first for future format migrations)
+            self._atomic_write_bytes(self.credentials_file,
+                                     _CREDS_VERSION_AESGCM + nonce + ciphertext)
+
             # Restrict file permissions (Unix/Linux)
             if os.name != 'nt':  # Not Windows
                 os.chmod(self.credentials_file, 0o600)
@@ -116,8 +241,13 @@ class ConfigManager:
                 encrypted_data = f.read()
             
             # Decrypt
-            decrypted_data = self.cipher.decrypt(encrypted_data)
-            credentials = json.loads(decrypted_data.decode())
+            if encrypted_data[:1] == _CREDS_VERSION_AESGCM:
+                nonce, ciphertext = encrypted_data[1:13], encrypted_data[13:]
+                plaintext = self.aead.decrypt(nonce, ciphertext, _CREDS_AAD)
+            else:
+                # Legacy Fernet-encrypted file
+                plaintext = self.cipher.decrypt(encrypted_data)
+            credentials = _loads_bytes(plaintext)
             
             logger.info("Credentials loaded successfully")
             return credentials
@@ -133,8 +263,10 @@ class ConfigManager:
             endpoints: List or Dictionary of endpoint info
         """
         try:
-            with open(self.endpoints_file, 'w') as f:
-                json.dump(endpoints, f, indent=2)
+            # Compact output - pretty-printing is left to the export command
+            self._atomic_write_bytes(self.endpoints_file, _dumps_bytes(endpoints))
+            self._endpoints_cache = copy.deepcopy(endpoints)
+            self._endpoints_mtime = self.endpoints_file.stat().st_mtime_ns
             logger.info("Endpoints saved successfully")
         except Exception as e:
             logger.error(f"Failed to save endpoints: {e}", exc_info=True)
@@ -150,16 +282,28 @@ class ConfigManager:
         try:
             if not self.endpoints_file.exists():
                 return []
-            
-            with open(self.endpoints_file, 'r') as f:
-                endpoints = json.load(f)
-            
+
+            # Serve from cache while the file on disk is unchanged
+            mtime = self.endpoints_file.stat().st_mtime_ns
+            if self._endpoints_cache is not None and mtime == self._endpoints_mtime:
+                return copy.deepcopy(self._endpoints_cache)
+
+            with open(self.endpoints_file, 'rb') as f:
+                endpoints = _loads_bytes(f.read())
+
+            self._endpoints_cache = copy.deepcopy(endpoints)
+            self._endpoints_mtime = mtime
+
             logger.info("Endpoints loaded successfully")
             return endpoints
         except Exception as e:
             logger.error(f"Failed to load endpoints: {e}", exc_info=True)
             return []
     
+    def get_credentials(self, provider):
+        """Get the credential fields for a single provider (or {} if unset)"""
+        return self.load_credentials().get(provider, {})
+
     def get_endpoints(self):
         """Alias for load_endpoints for backward compatibility"""
         return self.load_endpoints()
@@ -180,8 +324,10 @@ class ConfigManager:
             config: Dictionary of configuration settings
         """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Compact output - pretty-printing is left to the export command
+            self._atomic_write_bytes(self.config_file, _dumps_bytes(config))
+            self._config_cache = copy.deepcopy(config)
+            self._config_mtime = self.config_file.stat().st_mtime_ns
             logger.info("Config saved successfully")
         except Exception as e:
             logger.error(f"Failed to save config: {e}", exc_info=True)
@@ -197,10 +343,18 @@ class ConfigManager:
         try:
             if not self.config_file.exists():
                 return {}
-            
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-            
+
+            # Serve from cache while the file on disk is unchanged
+            mtime = self.config_file.stat().st_mtime_ns
+            if self._config_cache is not None and mtime == self._config_mtime:
+                return copy.deepcopy(self._config_cache)
+
+            with open(self.config_file, 'rb') as f:
+                config = _loads_bytes(f.read())
+
+            self._config_cache = copy.deepcopy(config)
+            self._config_mtime = mtime
+
             return config
         except Exception as e:
             logger.error(f"Failed to load config: {e}", exc_info=True)
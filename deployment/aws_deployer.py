@@ -10,45 +10,122 @@ See PLATFORM_SELECTION_GPU_REQUIREMENTS.md for details.
 """
 
 import boto3
+import functools
 import logging
 import time
 import base64
 import json
 from typing import Dict, List, Optional
-from datetime import datetime
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Map node types to NVIDIA NIM container images
+# These would be from NVIDIA's registry or ECR
+_NIM_IMAGE_MAP = {
+    "FLUX Dev": "nvcr.io/nim/nim_flux_dev",
+    "FLUX Canny": "nvcr.io/nim/nim_flux_canny",
+    "FLUX Depth": "nvcr.io/nim/nim_flux_depth",
+    "FLUX Kontext": "nvcr.io/nim/nim_flux_kontext",
+    "SDXL": "nvcr.io/nim/nim_sdxl",
+    "Llama 3": "nvcr.io/nim/nim_llama3",
+    "Mixtral": "nvcr.io/nim/nim_mixtral",
+    "Phi-3": "nvcr.io/nim/nim_phi3"
+}
+
+
+# Instance RAM (GB) per supported GPU instance type, used to size task
+# memory so host RAM isn't left stranded
+_GPU_INSTANCE_RAM_GB = {
+    'g4dn.xlarge': 16,
+    'g4dn.2xlarge': 32,
+    'g5.xlarge': 16,
+    'g5.2xlarge': 32,
+    'g5.12xlarge': 192,
+    'p3.2xlarge': 61,
+    'p4d.24xlarge': 1152,
+}
+
+# Cluster placement group used to co-locate multi-GPU instances for
+# low-latency NCCL traffic between nodes
+_PLACEMENT_GROUP_NAME = 'budgetguard-nim-cluster-pg'
+
+# User data script to configure ECS cluster registration, pre-encoded at
+# import time since the cluster name is fixed
+# ECS-optimized AMIs already have ECS agent installed
+_GPU_USER_DATA = """#!/bin/bash
+# Configure ECS cluster
+echo ECS_CLUSTER=budgetguard-nim-cluster >> /etc/ecs/ecs.config
+
+# For GPU instances, ensure NVIDIA drivers and nvidia-docker are available
+# ECS GPU-optimized AMI should have these pre-installed
+"""
+_GPU_USER_DATA_B64 = base64.b64encode(_GPU_USER_DATA.encode('utf-8')).decode('ascii')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session(access_key_id: str, secret_access_key: str, region: str) -> boto3.Session:
+    """
+    Build (and cache) a boto3 Session per credential/region combination.
+
+    Session creation re-parses credential/config files (~25 ms); reuse
+    makes additional AWSDeployer instances for the same account
+    effectively free.
+    """
+    return boto3.Session(
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _nim_repository_name(node_type: str) -> str:
+    """Resolve the NIM container image for a node type (cached)"""
+    return _NIM_IMAGE_MAP.get(node_type, f"nvcr.io/nim/nim_{node_type.lower().replace(' ', '_')}")
+
+
+# Shared client config: pooled keep-alive connections avoid a TLS
+# handshake per API call, and adaptive retries absorb Describe* throttling
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
 
 class AWSDeployer:
     """Deploys NIM instances to AWS"""
     
     def __init__(self, access_key_id: str, secret_access_key: str, region: str = 'us-east-1',
-                 gpu_instance_type: str = None):
+                 gpu_instance_type: str = None, use_spot: bool = False):
         """
         Initialize AWS Deployer
-        
+
         Args:
             access_key_id: AWS Access Key ID
             secret_access_key: AWS Secret Access Key
             region: AWS region (default: us-east-1)
-            gpu_instance_type: GPU instance type (default: g4dn.xlarge for T4, 
+            gpu_instance_type: GPU instance type (default: g4dn.xlarge for T4,
                              or g5.xlarge for A10G - recommended for SD/FLUX models)
+            use_spot: Request mostly-Spot GPU capacity (60-70% cheaper, for
+                     workloads that tolerate interruption)
         """
         self.region = region
-        self.session = boto3.Session(
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name=region
-        )
+        self.use_spot = use_spot
+        self.session = _get_session(access_key_id, secret_access_key, region)
         
-        # Initialize AWS clients
-        self.ecs_client = self.session.client('ecs')
-        self.ec2_client = self.session.client('ec2')
-        self.ecr_client = self.session.client('ecr')
-        self.logs_client = self.session.client('logs')
-        self.autoscaling_client = self.session.client('autoscaling')
-        self.iam_client = self.session.client('iam')
+        # Initialize AWS clients (shared pooled/keep-alive config)
+        self.ecs_client = self.session.client('ecs', config=_BOTO_CONFIG)
+        self.ec2_client = self.session.client('ec2', config=_BOTO_CONFIG)
+        self.ecr_client = self.session.client('ecr', config=_BOTO_CONFIG)
+        self.logs_client = self.session.client('logs', config=_BOTO_CONFIG)
+        self.autoscaling_client = self.session.client('autoscaling', config=_BOTO_CONFIG)
+        self.iam_client = self.session.client('iam', config=_BOTO_CONFIG)
         
         # Default GPU instance type (can be overridden)
         # T4 (g4dn) is cost-effective but slower for SD/FLUX models
@@ -65,6 +142,27 @@ class AWSDeployer:
         # - p3.2xlarge: 1x V100 (16GB VRAM, older but still capable)
         # - p4d.24xlarge: 8x A100 (40GB VRAM each, best for production)
         
+        # Known deployments: instance_name -> (cluster_name, service_name),
+        # populated on deploy so start/stop/status skip the cluster scan
+        self._deployment_index: Dict[str, tuple] = {}
+
+        # Registered task-definition families: family name -> ARN, so batch
+        # deploys of the same node type skip the describe probe entirely
+        self._taskdef_arn_cache: Dict[str, str] = {}
+
+        # GPU AMI resolution: region -> (ami_id, fetched_at); the
+        # recommended AMI changes at most weekly, so a 1 hour TTL is safe
+        self._ami_cache: Dict[str, tuple] = {}
+
+        # Shared ALB for NIM endpoints: {'alb_arn': ..., 'dns': ...} once
+        # resolved, so endpoint lookups stop chasing per-task EC2 IPs.
+        # Each service gets its own target group and listener port
+        # (cached by service name as (tg_arn, port)) - one shared group
+        # would round-robin callers across different models, and ALB
+        # can't rewrite paths for prefix-based routing.
+        self._alb_cache: Dict[str, str] = {}
+        self._tg_arn_cache: Dict[str, tuple] = {}
+
         logger.info(f"AWS Deployer initialized for region: {region} with GPU instance type: {self.gpu_instance_type}")
     
     def deploy_nim_instance(self, node_type: str, instance_name: str = None, 
@@ -87,27 +185,44 @@ class AWSDeployer:
         try:
             # For Phase 2, we'll use ECS (Elastic Container Service) as it's simpler than EKS
             # This will deploy NIM as a containerized service
-            
-            # Step 1: Get or create ECS cluster with EC2 capacity
+
+            # Steps 1-3 have no data dependencies on each other, so run the
+            # cluster, network and IAM setup concurrently to collapse the
+            # cold-start API round-trips
+            from concurrent.futures import ThreadPoolExecutor
+
             cluster_name = "budgetguard-nim-cluster"
-            cluster_arn = self._get_or_create_cluster(cluster_name)
-            
-            # Step 2: Ensure EC2 instances are available in cluster (GPU instances)
-            self._ensure_ec2_capacity(cluster_name)
-            
-            # Step 3: Get or create ECR repository for NIM images
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                cluster_future = executor.submit(self._get_or_create_cluster, cluster_name)
+                network_future = executor.submit(self._get_or_create_network_resources)
+                role_future = executor.submit(self._get_or_create_ecs_instance_role)
+                cluster_arn = cluster_future.result()
+                network_resources = network_future.result()
+                instance_role_arn = role_future.result()
+
+            # Ensure EC2 instances are available in cluster (GPU instances)
+            self._ensure_ec2_capacity(cluster_name,
+                                      network_resources=network_resources,
+                                      instance_role_arn=instance_role_arn)
+
+            # Get or create ECR repository for NIM images
             # Note: In production, we'd pull from NVIDIA's container registry
             # For now, we'll assume NVIDIA provides public ECR images or we use their registry
             repo_name = self._get_nim_repository_name(node_type)
             
             # Step 4: Create task definition for NIM with GPU support
-            task_def = self._create_task_definition(node_type, instance_name)
+            task_def = self._create_task_definition(node_type)
             
             # Step 5: Create ECS service with EC2 launch type
-            service = self._create_ecs_service(cluster_arn, task_def, instance_name, scale_to_zero)
+            service = self._create_ecs_service(cluster_name, task_def, instance_name,
+                                               scale_to_zero, network_resources)
             
+            # Record where the service lives so later lifecycle calls can
+            # address it directly
+            self._deployment_index[instance_name] = (cluster_name, service['serviceName'])
+
             # Step 6: Get endpoint URL
-            endpoint_url = self._get_endpoint_url(service, instance_name)
+            endpoint_url = self._get_endpoint_url(service, instance_name, cluster_name)
             
             deployment_info = {
                 "node_type": node_type,
@@ -117,7 +232,7 @@ class AWSDeployer:
                 "endpoint": endpoint_url,
                 "cluster": cluster_name,
                 "service": service['serviceName'],
-                "deployed_at": datetime.utcnow().isoformat() + "Z",
+                "deployed_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
                 "status": "running"
             }
             
@@ -130,14 +245,13 @@ class AWSDeployer:
     
     def _get_or_create_cluster(self, cluster_name: str) -> str:
         """Get existing ECS cluster or create new one"""
-        try:
-            response = self.ecs_client.describe_clusters(clusters=[cluster_name])
-            if response['clusters'] and response['clusters'][0]['status'] == 'ACTIVE':
-                logger.info(f"Using existing cluster: {cluster_name}")
-                return response['clusters'][0]['clusterArn']
-        except Exception:
-            pass
-        
+        # describe_clusters doesn't raise for a missing cluster - it just
+        # returns an empty list, so no exception dance is needed
+        response = self.ecs_client.describe_clusters(clusters=[cluster_name])
+        if response['clusters'] and response['clusters'][0]['status'] == 'ACTIVE':
+            logger.info(f"Using existing cluster: {cluster_name}")
+            return response['clusters'][0]['clusterArn']
+
         # Create new cluster (for EC2 launch type)
         logger.info(f"Creating new ECS cluster: {cluster_name}")
         response = self.ecs_client.create_cluster(
@@ -153,28 +267,39 @@ class AWSDeployer:
         )
         return response['cluster']['clusterArn']
     
-    def _ensure_ec2_capacity(self, cluster_name: str):
-        """Ensure EC2 instances with GPU support are available in the cluster"""
+    def _ensure_ec2_capacity(self, cluster_name: str, network_resources: tuple = None,
+                             instance_role_arn: str = None):
+        """
+        Ensure EC2 instances with GPU support are available in the cluster
+
+        Args:
+            cluster_name: ECS cluster name
+            network_resources: Optional prefetched (vpc_id, subnet_ids, sg_id)
+            instance_role_arn: Optional prefetched instance role ARN
+        """
         try:
             # Check if Auto Scaling Group already exists
             asg_name = f"budgetguard-nim-asg-{cluster_name.replace('_', '-')}"
             
-            try:
-                self.autoscaling_client.describe_auto_scaling_groups(
-                    AutoScalingGroupNames=[asg_name]
-                )
+            # describe_auto_scaling_groups returns an empty list for a
+            # missing ASG rather than raising
+            response = self.autoscaling_client.describe_auto_scaling_groups(
+                AutoScalingGroupNames=[asg_name]
+            )
+            if response['AutoScalingGroups']:
                 logger.info(f"Auto Scaling Group already exists: {asg_name}")
                 return
-            except:
-                pass  # ASG doesn't exist, create it
-            
+
             logger.info(f"Setting up EC2 capacity with GPU instances for cluster: {cluster_name}")
             
-            # Get VPC and subnets
-            vpc_id, subnet_ids, security_group_id = self._get_or_create_network_resources()
-            
-            # Create IAM role for ECS instances
-            instance_role_arn = self._get_or_create_ecs_instance_role()
+            # Get VPC and subnets (unless prefetched by the caller)
+            if network_resources is None:
+                network_resources = self._get_or_create_network_resources()
+            vpc_id, subnet_ids, security_group_id = network_resources
+
+            # Create IAM role for ECS instances (unless prefetched)
+            if instance_role_arn is None:
+                instance_role_arn = self._get_or_create_ecs_instance_role()
             
             # Create Launch Template with GPU instance
             launch_template_name = f"budgetguard-nim-launch-template-{int(time.time())}"
@@ -195,55 +320,58 @@ class AWSDeployer:
     
     def _get_nim_repository_name(self, node_type: str) -> str:
         """Get ECR repository name for NIM node type"""
-        # Map node types to NVIDIA NIM container images
-        # These would be from NVIDIA's registry or ECR
-        nim_image_map = {
-            "FLUX Dev": "nvcr.io/nim/nim_flux_dev",
-            "FLUX Canny": "nvcr.io/nim/nim_flux_canny",
-            "FLUX Depth": "nvcr.io/nim/nim_flux_depth",
-            "FLUX Kontext": "nvcr.io/nim/nim_flux_kontext",
-            "SDXL": "nvcr.io/nim/nim_sdxl",
-            "Llama 3": "nvcr.io/nim/nim_llama3",
-            "Mixtral": "nvcr.io/nim/nim_mixtral",
-            "Phi-3": "nvcr.io/nim/nim_phi3"
-        }
-        
-        return nim_image_map.get(node_type, f"nvcr.io/nim/nim_{node_type.lower().replace(' ', '_')}")
+        return _nim_repository_name(node_type)
     
-    def _create_task_definition(self, node_type: str, instance_name: str) -> str:
+    def _create_task_definition(self, node_type: str) -> str:
         """Create ECS task definition for NIM instance"""
         image_uri = self._get_nim_repository_name(node_type)
         
         task_def_name = f"budgetguard-nim-{node_type.lower().replace(' ', '-')}"
         
+        # Check the in-process cache first, then probe ECS
+        cached_arn = self._taskdef_arn_cache.get(task_def_name)
+        if cached_arn:
+            logger.info(f"Using cached task definition: {task_def_name}")
+            return cached_arn
+
         # Check if task definition already exists
         try:
             response = self.ecs_client.describe_task_definition(taskDefinition=task_def_name)
             logger.info(f"Using existing task definition: {task_def_name}")
-            return response['taskDefinition']['taskDefinitionArn']
-        except Exception:
-            pass
+            arn = response['taskDefinition']['taskDefinitionArn']
+            self._taskdef_arn_cache[task_def_name] = arn
+            return arn
+        except ClientError as e:
+            # ECS reports an unknown family as ClientException
+            if e.response['Error']['Code'] != 'ClientException':
+                raise
         
         # Create new task definition
         logger.info(f"Creating task definition: {task_def_name}")
         
         # NIM containers require GPU access - use EC2 launch type
-        # For g4dn.xlarge: 4 vCPU, 16 GB RAM, 1 NVIDIA T4 GPU
+        # Size task memory to ~90% of the instance's RAM so the host isn't
+        # left half-idle; g4dn/g5 support ENI trunking, so awsvpc mode (one
+        # ENI per task) still allows multiple NIM tasks per instance
+        instance_ram_gb = _GPU_INSTANCE_RAM_GB.get(self.gpu_instance_type, 16)
         task_def = {
             'family': task_def_name,
-            'networkMode': 'bridge',  # EC2 launch type can use bridge mode
+            'networkMode': 'awsvpc',  # One ENI per task (trunked on g4dn/g5)
             'requiresCompatibilities': ['EC2'],  # GPU requires EC2 launch type
             'cpu': '4096',  # 4 vCPU
-            'memory': '8192',  # 8 GB RAM (16 GB available, but limit to 8 GB for task)
+            'memory': str(int(instance_ram_gb * 0.9 * 1024)),
             'containerDefinitions': [
                 {
-                    'name': instance_name,
+                    # Named after the family, not any one instance: the
+                    # family (and its cached task def) is shared by every
+                    # instance of the node type, and the service's
+                    # loadBalancers.containerName must match it
+                    'name': task_def_name,
                     'image': image_uri,
                     'essential': True,
                     'portMappings': [
                         {
-                            'containerPort': 8000,  # Typical NIM API port
-                            'hostPort': 8000,  # Map to host port
+                            'containerPort': 8000,  # Typical NIM API port (awsvpc: host port matches)
                             'protocol': 'tcp'
                         }
                     ],
@@ -270,12 +398,16 @@ class AWSDeployer:
         # Create CloudWatch log group
         try:
             self.logs_client.create_log_group(logGroupName=f'/ecs/{task_def_name}')
-        except:
-            pass  # Log group may already exist
-        
-        return response['taskDefinition']['taskDefinitionArn']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ResourceAlreadyExistsException':
+                raise
+
+        arn = response['taskDefinition']['taskDefinitionArn']
+        self._taskdef_arn_cache[task_def_name] = arn
+        return arn
     
-    def _create_ecs_service(self, cluster_arn: str, task_def_arn: str, service_name: str, scale_to_zero: bool = True) -> Dict:
+    def _create_ecs_service(self, cluster_name: str, task_def_arn: str, service_name: str,
+                            scale_to_zero: bool = True, network_resources: tuple = None) -> Dict:
         """Create ECS service with EC2 launch type"""
         logger.info(f"Creating ECS service: {service_name} with EC2 launch type")
         
@@ -283,39 +415,94 @@ class AWSDeployer:
         # For EC2, we can set to 0 and start manually via start_deployment
         desired_count = 0 if scale_to_zero else 1
         
+        # Match the configured GPU family so g5 deployers don't get pinned
+        # to g4dn hosts
+        instance_family = self.gpu_instance_type.split('.')[0]
+
         service_config = {
-            'cluster': cluster_arn.split('/')[-1],
+            'cluster': cluster_name,
             'serviceName': service_name,
-            'taskDefinition': task_def_arn.split('/')[-1],
+            'taskDefinition': task_def_arn,  # ECS accepts the full ARN directly
             'desiredCount': desired_count,
             'launchType': 'EC2',  # Use EC2 for GPU support
             'placementConstraints': [
                 {
                     'type': 'memberOf',
-                    'expression': 'attribute:ecs.instance-type =~ g4dn.*'  # Prefer GPU instances
+                    'expression': f'attribute:ecs.instance-type =~ {instance_family}.*'  # Prefer GPU instances
                 }
             ],
+            # Binpack so tasks fill existing GPU instances before new ones
+            # spin up - spreading across instances left expensive GPUs idle
             'placementStrategy': [
                 {
-                    'type': 'spread',
-                    'field': 'instanceId'  # Spread tasks across instances
+                    'type': 'binpack',
+                    'field': 'memory'
+                },
+                {
+                    'type': 'binpack',
+                    'field': 'cpu'  # Tiebreaker
                 }
             ]
         }
-        
+
+        # awsvpc task networking needs explicit subnets/security groups
+        if network_resources is None:
+            network_resources = self._get_or_create_network_resources()
+        _, subnet_ids, security_group_id = network_resources
+        service_config['networkConfiguration'] = {
+            'awsvpcConfiguration': {
+                'subnets': subnet_ids,
+                'securityGroups': [security_group_id],
+                # ECS rejects ENABLED for the EC2 launch type; inbound
+                # traffic arrives through the ALB and outbound follows
+                # the subnet route
+                'assignPublicIp': 'DISABLED'
+            }
+        }
+
+        # Register tasks with this service's own ALB target group so
+        # callers get a stable DNS endpoint instead of a per-task EC2 IP.
+        # The container in the task definition is named after the task-def
+        # family (shared per node type), so derive it from the ARN.
+        container_name = task_def_arn.split('/')[-1].split(':')[0]
+        try:
+            tg_arn, _ = self._get_or_create_target_group(service_name, network_resources)
+            service_config['loadBalancers'] = [{
+                'targetGroupArn': tg_arn,
+                'containerName': container_name,
+                'containerPort': 8000
+            }]
+        except ClientError as e:
+            logger.warning(f"Could not attach ALB target group: {e}")
+
         try:
             response = self.ecs_client.create_service(**service_config)
             logger.info(f"ECS service created: {service_name}")
-            return response['service']
-        except Exception as e:
-            if 'already exists' in str(e).lower():
+            service = response['service']
+        except ClientError as e:
+            if 'already exists' in e.response['Error'].get('Message', '').lower():
                 # Service already exists, get it
                 response = self.ecs_client.describe_services(
-                    cluster=cluster_arn.split('/')[-1],
+                    cluster=cluster_name,
                     services=[service_name]
                 )
-                return response['services'][0]
-            raise
+                service = response['services'][0]
+            else:
+                raise
+
+        # Wait for the service to settle; the waiter polls with backoff and
+        # returns as soon as the service is stable (immediately for
+        # scale-to-zero services with desiredCount=0)
+        try:
+            self.ecs_client.get_waiter('services_stable').wait(
+                cluster=cluster_name,
+                services=[service_name],
+                WaiterConfig={'Delay': 5, 'MaxAttempts': 24}
+            )
+        except Exception as e:
+            logger.warning(f"Service {service_name} not stable yet: {e}")
+
+        return service
     
     def _get_or_create_network_resources(self) -> tuple:
         """Get or create VPC, subnets, and security group"""
@@ -339,17 +526,15 @@ class AWSDeployer:
         )
         subnet_ids = [s['SubnetId'] for s in subnets['Subnets'][:2]]  # Use first 2 subnets
         
-        # Create security group for NIM
+        # Create security group for NIM - a filtered describe returns an
+        # empty list when the group doesn't exist, no exception needed
         sg_name = "budgetguard-nim-sg"
-        try:
-            sgs = self.ec2_client.describe_security_groups(
-                Filters=[{'Name': 'group-name', 'Values': [sg_name]}]
-            )
-            if sgs['SecurityGroups']:
-                sg_id = sgs['SecurityGroups'][0]['GroupId']
-            else:
-                raise Exception("Security group not found")
-        except:
+        sgs = self.ec2_client.describe_security_groups(
+            Filters=[{'Name': 'group-name', 'Values': [sg_name]}]
+        )
+        if sgs['SecurityGroups']:
+            sg_id = sgs['SecurityGroups'][0]['GroupId']
+        else:
             # Create security group
             sg = self.ec2_client.create_security_group(
                 GroupName=sg_name,
@@ -371,7 +556,223 @@ class AWSDeployer:
                 ]
             )
         
+        # Keep multi-GB NIM image pulls on the AWS backbone instead of NAT
+        try:
+            self._ensure_vpc_endpoints(vpc_id, subnet_ids)
+        except ClientError as e:
+            logger.warning(f"Could not set up VPC endpoints: {e}")
+
+        # Multi-GPU distributed workloads benefit from a cluster placement
+        # group (co-located instances, full-bandwidth ENA/EFA networking)
+        if self._is_multi_gpu_instance():
+            groups = self.ec2_client.describe_placement_groups(
+                Filters=[{'Name': 'group-name', 'Values': [_PLACEMENT_GROUP_NAME]}]
+            )
+            if not groups['PlacementGroups']:
+                logger.info(f"Creating cluster placement group: {_PLACEMENT_GROUP_NAME}")
+                self.ec2_client.create_placement_group(
+                    GroupName=_PLACEMENT_GROUP_NAME,
+                    Strategy='cluster'
+                )
+
         return vpc_id, subnet_ids, sg_id
+
+    # First listener port handed out for per-service routing; each new
+    # service takes the next free port on the shared ALB
+    _ALB_BASE_PORT = 8000
+
+    def _get_or_create_alb(self, network_resources: tuple = None) -> tuple:
+        """
+        Provision (or look up) the shared Application Load Balancer.
+
+        A stable ALB DNS name survives task restarts and removes the
+        per-call describe_tasks -> describe_network_interfaces chain from
+        the endpoint hot path. Routing to individual services happens via
+        per-service listener ports (see _get_or_create_target_group).
+
+        Returns:
+            (alb_arn, alb_dns_name)
+        """
+        if self._alb_cache:
+            return self._alb_cache['alb_arn'], self._alb_cache['dns']
+
+        elbv2 = self.session.client('elbv2', config=_BOTO_CONFIG)
+        alb_name = 'budgetguard-nim-alb'
+
+        if network_resources is None:
+            network_resources = self._get_or_create_network_resources()
+        _, subnet_ids, security_group_id = network_resources
+
+        try:
+            lbs = elbv2.describe_load_balancers(Names=[alb_name])
+            alb = lbs['LoadBalancers'][0]
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'LoadBalancerNotFound':
+                raise
+            logger.info(f"Creating Application Load Balancer: {alb_name}")
+            alb = elbv2.create_load_balancer(
+                Name=alb_name,
+                Subnets=subnet_ids,
+                SecurityGroups=[security_group_id],
+                Scheme='internet-facing',
+                Type='application'
+            )['LoadBalancers'][0]
+
+        self._alb_cache = {'alb_arn': alb['LoadBalancerArn'], 'dns': alb['DNSName']}
+        return alb['LoadBalancerArn'], alb['DNSName']
+
+    def _get_or_create_target_group(self, service_name: str,
+                                    network_resources: tuple = None) -> tuple:
+        """
+        Provision (or look up) a service's own target group and the
+        dedicated listener port that forwards to it.
+
+        One target group per service keeps requests for a model on that
+        model's tasks - a shared group would round-robin across every NIM
+        deployed. Routing is port-based (http://<alb-dns>:<port>) because
+        ALB has no path-rewrite: a path-prefix rule would deliver the
+        prefix to the NIM container, which would 404.
+
+        Returns:
+            (target_group_arn, listener_port)
+        """
+        cached = self._tg_arn_cache.get(service_name)
+        if cached:
+            return cached
+
+        alb_arn, _ = self._get_or_create_alb(network_resources)
+        if network_resources is None:
+            network_resources = self._get_or_create_network_resources()
+        vpc_id, _, security_group_id = network_resources
+
+        elbv2 = self.session.client('elbv2', config=_BOTO_CONFIG)
+        # Target group names are capped at 32 chars
+        tg_name = service_name[:32].rstrip('-')
+        listeners = elbv2.describe_listeners(LoadBalancerArn=alb_arn)['Listeners']
+
+        try:
+            tgs = elbv2.describe_target_groups(Names=[tg_name])
+            tg_arn = tgs['TargetGroups'][0]['TargetGroupArn']
+            # Reuse the listener already forwarding to this group
+            for listener in listeners:
+                if any(action.get('TargetGroupArn') == tg_arn
+                       for action in listener.get('DefaultActions', [])):
+                    self._tg_arn_cache[service_name] = (tg_arn, listener['Port'])
+                    return tg_arn, listener['Port']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'TargetGroupNotFound':
+                raise
+            logger.info(f"Creating target group: {tg_name}")
+            tg = elbv2.create_target_group(
+                Name=tg_name,
+                Protocol='HTTP',
+                Port=8000,
+                VpcId=vpc_id,
+                TargetType='ip',  # awsvpc tasks register by ENI IP
+                HealthCheckPath='/v1/health/ready'
+            )
+            tg_arn = tg['TargetGroups'][0]['TargetGroupArn']
+
+        # Dedicated listener on the next free port, whole-port forward -
+        # requests reach the container with their path untouched
+        taken = {listener['Port'] for listener in listeners}
+        port = self._ALB_BASE_PORT
+        while port in taken:
+            port += 1
+        elbv2.create_listener(
+            LoadBalancerArn=alb_arn,
+            Protocol='HTTP',
+            Port=port,
+            DefaultActions=[{'Type': 'forward', 'TargetGroupArn': tg_arn}]
+        )
+
+        # The shared security group fronts the ALB too - open the port
+        try:
+            self.ec2_client.authorize_security_group_ingress(
+                GroupId=security_group_id,
+                IpPermissions=[{
+                    'IpProtocol': 'tcp',
+                    'FromPort': port,
+                    'ToPort': port,
+                    'IpRanges': [{'CidrIp': '0.0.0.0/0'}]  # Restrict in production
+                }]
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'InvalidPermission.Duplicate':
+                raise
+
+        self._tg_arn_cache[service_name] = (tg_arn, port)
+        return tg_arn, port
+
+    def _service_listener_port(self, service_name: str) -> Optional[int]:
+        """Listener port for a service's target group, resolved once and cached"""
+        cached = self._tg_arn_cache.get(service_name)
+        if cached:
+            return cached[1]
+        if not self._alb_cache:
+            return None
+        try:
+            elbv2 = self.session.client('elbv2', config=_BOTO_CONFIG)
+            tgs = elbv2.describe_target_groups(Names=[service_name[:32].rstrip('-')])
+            tg_arn = tgs['TargetGroups'][0]['TargetGroupArn']
+            listeners = elbv2.describe_listeners(
+                LoadBalancerArn=self._alb_cache['alb_arn']
+            )
+            for listener in listeners['Listeners']:
+                if any(action.get('TargetGroupArn') == tg_arn
+                       for action in listener.get('DefaultActions', [])):
+                    self._tg_arn_cache[service_name] = (tg_arn, listener['Port'])
+                    return listener['Port']
+        except ClientError:
+            pass
+        return None
+
+    def _ensure_vpc_endpoints(self, vpc_id: str, subnet_ids: List[str]):
+        """
+        Idempotently create the S3/ECR/logs VPC endpoints.
+
+        ECR image layers are served from S3; with a Gateway endpoint for S3
+        and Interface endpoints for ecr.dkr/ecr.api/logs, multi-GB NIM
+        pulls stay on the AWS backbone at line rate instead of paying NAT
+        egress, roughly halving GPU task cold-start.
+        """
+        existing = self.ec2_client.describe_vpc_endpoints(
+            Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
+        )
+        existing_services = {ep['ServiceName'] for ep in existing['VpcEndpoints']}
+
+        s3_service = f'com.amazonaws.{self.region}.s3'
+        if s3_service not in existing_services:
+            route_tables = self.ec2_client.describe_route_tables(
+                Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
+            )
+            logger.info(f"Creating S3 Gateway VPC endpoint in {vpc_id}")
+            self.ec2_client.create_vpc_endpoint(
+                VpcEndpointType='Gateway',
+                VpcId=vpc_id,
+                ServiceName=s3_service,
+                RouteTableIds=[rt['RouteTableId'] for rt in route_tables['RouteTables']]
+            )
+
+        for suffix in ('ecr.dkr', 'ecr.api', 'logs'):
+            service_name = f'com.amazonaws.{self.region}.{suffix}'
+            if service_name not in existing_services:
+                logger.info(f"Creating Interface VPC endpoint for {suffix} in {vpc_id}")
+                self.ec2_client.create_vpc_endpoint(
+                    VpcEndpointType='Interface',
+                    VpcId=vpc_id,
+                    ServiceName=service_name,
+                    SubnetIds=subnet_ids
+                )
+
+    def _is_multi_gpu_instance(self) -> bool:
+        """Whether the configured instance type carries multiple GPUs"""
+        if self.gpu_instance_type.startswith(('p4', 'p5')):
+            return True
+        # g5.12xlarge and larger carry 4+ A10G GPUs
+        if self.gpu_instance_type.startswith('g5.'):
+            return self.gpu_instance_type.split('.', 1)[1] in ('12xlarge', '24xlarge', '48xlarge')
+        return False
     
     def _get_or_create_ecs_instance_role(self) -> str:
         """Get or create IAM role for ECS EC2 instances"""
@@ -382,8 +783,9 @@ class AWSDeployer:
             response = self.iam_client.get_role(RoleName=role_name)
             logger.info(f"Using existing IAM role: {role_name}")
             return response['Role']['Arn']
-        except:
-            pass
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchEntity':
+                raise
         
         # Create role
         logger.info(f"Creating IAM role: {role_name}")
@@ -423,46 +825,54 @@ class AWSDeployer:
                 InstanceProfileName=profile_name,
                 RoleName=role_name
             )
-        except:
-            pass  # Profile may already exist
+        except ClientError as e:
+            # Profile may already exist (with the role already attached)
+            if e.response['Error']['Code'] not in ('EntityAlreadyExists', 'LimitExceeded'):
+                raise
         
         logger.info(f"IAM role created: {role_name}")
         return role['Role']['Arn']
     
-    def _create_launch_template(self, template_name: str, instance_role_arn: str, security_group_id: str) -> str:
-        """Create EC2 Launch Template with GPU instance configuration"""
-        logger.info(f"Creating Launch Template: {template_name} with GPU instance type: {self.gpu_instance_type}")
-        
-        # Get instance profile name from role ARN
-        instance_profile_name = instance_role_arn.split('/')[-1]
-        
-        # User data script to configure ECS cluster registration
-        # ECS-optimized AMIs already have ECS agent installed
-        cluster_name = "budgetguard-nim-cluster"
-        user_data = f"""#!/bin/bash
-# Configure ECS cluster
-echo ECS_CLUSTER={cluster_name} >> /etc/ecs/ecs.config
+    # How long a resolved AMI ID is trusted before re-querying SSM
+    _AMI_CACHE_TTL = 3600.0
+
+    def _get_gpu_ami_id(self) -> Optional[str]:
+        """Resolve the ECS GPU-optimized AMI for this region (TTL-cached)"""
+        cached = self._ami_cache.get(self.region)
+        if cached and time.time() - cached[1] < self._AMI_CACHE_TTL:
+            return cached[0]
 
-# For GPU instances, ensure NVIDIA drivers and nvidia-docker are available
-# ECS GPU-optimized AMI should have these pre-installed
-"""
-        
-        # Get ECS-optimized AMI with GPU support
-        # For g4dn instances, use ECS-optimized AMI with GPU support
         try:
-            ssm_client = self.session.client('ssm')
+            ssm_client = self.session.client('ssm', config=_BOTO_CONFIG)
+            # get_parameters (plural) keeps this a single round trip if a
+            # CPU-optimized AMI parameter is added alongside later
             ami_param = '/aws/service/ecs/optimized-ami/amazon-linux-2/gpu/recommended'
-            ami_info = ssm_client.get_parameter(Name=ami_param)
-            # SSM parameter returns JSON with image_id field
-            ami_data = json.loads(ami_info['Parameter']['Value'])
-            ami_id = ami_data.get('image_id')
-            if not ami_id:
-                # Try alternative format
-                ami_id = ami_info['Parameter']['Value']
+            response = ssm_client.get_parameters(Names=[ami_param])
+            ami_id = None
+            for parameter in response['Parameters']:
+                # SSM parameter returns JSON with image_id field
+                try:
+                    ami_id = json.loads(parameter['Value']).get('image_id') or parameter['Value']
+                except (ValueError, AttributeError):
+                    # Try alternative format
+                    ami_id = parameter['Value']
         except Exception as e:
             logger.warning(f"Could not get ECS GPU AMI from SSM: {e}. You may need to specify AMI manually.")
             # Fallback: Use a known GPU AMI or let user specify
             ami_id = None  # Will need to be specified or use default ECS-optimized AMI
+
+        self._ami_cache[self.region] = (ami_id, time.time())
+        return ami_id
+
+    def _create_launch_template(self, template_name: str, instance_role_arn: str, security_group_id: str) -> str:
+        """Create EC2 Launch Template with GPU instance configuration"""
+        logger.info(f"Creating Launch Template: {template_name} with GPU instance type: {self.gpu_instance_type}")
+        
+        # Get instance profile name from role ARN
+        instance_profile_name = instance_role_arn.split('/')[-1]
+
+        # Get ECS-optimized AMI with GPU support (cached with a TTL)
+        ami_id = self._get_gpu_ami_id()
         
         launch_template_data = {
             'InstanceType': self.gpu_instance_type,
@@ -470,7 +880,7 @@ echo ECS_CLUSTER={cluster_name} >> /etc/ecs/ecs.config
                 'Name': instance_profile_name
             },
             'SecurityGroupIds': [security_group_id],
-            'UserData': base64.b64encode(user_data.encode('utf-8')).decode('utf-8') if user_data else None,
+            'UserData': _GPU_USER_DATA_B64,
             'TagSpecifications': [
                 {
                     'ResourceType': 'instance',
@@ -486,6 +896,10 @@ echo ECS_CLUSTER={cluster_name} >> /etc/ecs/ecs.config
         # Add AMI ID if available
         if ami_id:
             launch_template_data['ImageId'] = ami_id
+
+        # Co-locate multi-GPU instances in the cluster placement group
+        if self._is_multi_gpu_instance():
+            launch_template_data['Placement'] = {'GroupName': _PLACEMENT_GROUP_NAME}
         
         try:
             response = self.ec2_client.create_launch_template(
@@ -494,9 +908,9 @@ echo ECS_CLUSTER={cluster_name} >> /etc/ecs/ecs.config
             )
             logger.info(f"Launch Template created: {template_name}")
             return response['LaunchTemplate']['LaunchTemplateId']
-        except Exception as e:
+        except ClientError as e:
             # Template may already exist
-            if 'already exists' in str(e).lower():
+            if e.response['Error']['Code'] == 'InvalidLaunchTemplateName.AlreadyExistsException':
                 response = self.ec2_client.describe_launch_templates(
                     LaunchTemplateNames=[template_name]
                 )
@@ -511,10 +925,6 @@ echo ECS_CLUSTER={cluster_name} >> /etc/ecs/ecs.config
         # This allows manual control via start/stop
         asg_config = {
             'AutoScalingGroupName': asg_name,
-            'LaunchTemplate': {
-                'LaunchTemplateId': launch_template_id,
-                'Version': '$Latest'
-            },
             'MinSize': 0,  # Can scale to zero
             'MaxSize': 10,  # Max 10 GPU instances
             'DesiredCapacity': 1,  # Start with 1 instance
@@ -539,170 +949,329 @@ echo ECS_CLUSTER={cluster_name} >> /etc/ecs/ecs.config
                 }
             ]
         }
-        
+
+        template_spec = {
+            'LaunchTemplateId': launch_template_id,
+            'Version': '$Latest'
+        }
+        if self.use_spot:
+            # Diversified Spot with a small on-demand floor; Spot GPU
+            # capacity is 60-70% cheaper and capacity-optimized allocation
+            # minimizes interruptions
+            asg_config['MixedInstancesPolicy'] = {
+                'LaunchTemplate': {
+                    'LaunchTemplateSpecification': template_spec,
+                    'Overrides': [
+                        {'InstanceType': instance_type}
+                        for instance_type in dict.fromkeys(
+                            [self.gpu_instance_type, 'g4dn.xlarge', 'g5.xlarge', 'g4dn.2xlarge']
+                        )
+                    ]
+                },
+                'InstancesDistribution': {
+                    'OnDemandBaseCapacity': 0,
+                    'OnDemandPercentageAboveBaseCapacity': 20,
+                    'SpotAllocationStrategy': 'capacity-optimized'
+                }
+            }
+        else:
+            asg_config['LaunchTemplate'] = template_spec
+
         try:
             self.autoscaling_client.create_auto_scaling_group(**asg_config)
             logger.info(f"Auto Scaling Group created: {asg_name}")
-        except Exception as e:
-            if 'already exists' in str(e).lower():
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'AlreadyExists':
                 logger.info(f"Auto Scaling Group already exists: {asg_name}")
             else:
                 raise
         
-        # Wait for instances to register with ECS cluster
+        # Wait for instances to register with ECS cluster - poll instead of
+        # a flat sleep so we return the moment an instance shows up
         logger.info("Waiting for EC2 instances to register with ECS cluster...")
-        time.sleep(30)  # Give instances time to start and register
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            container_instances = self.ecs_client.list_container_instances(cluster=cluster_name)
+            if container_instances['containerInstanceArns']:
+                logger.info("EC2 instance registered with ECS cluster")
+                return
+            time.sleep(2)
+        logger.warning("No EC2 instances registered with the ECS cluster yet; continuing")
     
-    def _get_endpoint_url(self, service: Dict, instance_name: str) -> str:
+    @staticmethod
+    def _task_eni_id(task: Dict) -> Optional[str]:
+        """ENI id from an awsvpc task's attachment details, or None"""
+        for attachment in task.get('attachments', []):
+            if attachment.get('type') == 'ElasticNetworkInterface':
+                for detail in attachment.get('details', []):
+                    if detail.get('name') == 'networkInterfaceId':
+                        return detail.get('value')
+        return None
+
+    def _eni_ips(self, eni_ids: List[str]) -> Dict[str, str]:
+        """
+        Resolve ENI ids to reachable IPs in batched calls.
+
+        awsvpc tasks listen on their own task ENI - the container
+        instance's address never has the port bound - so endpoint
+        fallbacks must look at the task ENI, preferring its public
+        association and falling back to the private address.
+        """
+        ips = {}
+        eni_ids = [eni_id for eni_id in eni_ids if eni_id]
+        for i in range(0, len(eni_ids), 100):
+            response = self.ec2_client.describe_network_interfaces(
+                NetworkInterfaceIds=eni_ids[i:i + 100]
+            )
+            for eni in response['NetworkInterfaces']:
+                ip = eni.get('Association', {}).get('PublicIp') or eni.get('PrivateIpAddress')
+                if ip:
+                    ips[eni['NetworkInterfaceId']] = ip
+        return ips
+
+    def _get_endpoint_url(self, service: Dict, instance_name: str,
+                          cluster_name: str = None) -> str:
         """Get endpoint URL for deployed NIM instance (EC2 launch type)"""
-        # Get task details
-        cluster_name = service['clusterArn'].split('/')[-1]
+        # Prefer the shared ALB's stable DNS once it's known - the
+        # service's own listener port gives each instance a distinct,
+        # directly-reachable URL with no path prefix to strip
+        if self._alb_cache:
+            port = self._service_listener_port(service['serviceName'])
+            if port:
+                return f"http://{self._alb_cache['dns']}:{port}"
+
+        # Get task details - callers that already know the cluster name pass
+        # it in so the ARN isn't re-parsed
+        if cluster_name is None:
+            cluster_name = service['clusterArn'].split('/')[-1]
         service_name = service['serviceName']
         
-        # Get running tasks
+        # Get running tasks - poll briefly with backoff instead of a flat
+        # 10 s sleep (scale-to-zero services legitimately have no tasks)
+        deadline = time.monotonic() + 10
         tasks = self.ecs_client.list_tasks(cluster=cluster_name, serviceName=service_name)
-        
-        if not tasks['taskArns']:
-            # Wait a bit for task to start
-            time.sleep(10)
+        while not tasks['taskArns'] and time.monotonic() < deadline:
+            time.sleep(2)
             tasks = self.ecs_client.list_tasks(cluster=cluster_name, serviceName=service_name)
-        
+
         if tasks['taskArns']:
+            # Let the tasks reach RUNNING so the container instance is attached
+            try:
+                self.ecs_client.get_waiter('tasks_running').wait(
+                    cluster=cluster_name,
+                    tasks=tasks['taskArns'],
+                    WaiterConfig={'Delay': 5, 'MaxAttempts': 12}
+                )
+            except Exception as e:
+                logger.warning(f"Tasks for {service_name} not running yet: {e}")
             task_details = self.ecs_client.describe_tasks(
                 cluster=cluster_name,
                 tasks=tasks['taskArns']
             )
             
             if task_details['tasks']:
-                task = task_details['tasks'][0]
-                
-                # For EC2 launch type with bridge network mode
-                # Get the EC2 instance ID from the task
-                container_instance_arn = task.get('containerInstanceArn')
-                if container_instance_arn:
-                    # Get container instance details
-                    container_instances = self.ecs_client.describe_container_instances(
-                        cluster=cluster_name,
-                        containerInstances=[container_instance_arn]
-                    )
-                    if container_instances['containerInstances']:
-                        ec2_instance_id = container_instances['containerInstances'][0]['ec2InstanceId']
-                        
-                        # Get EC2 instance public IP
-                        instances = self.ec2_client.describe_instances(InstanceIds=[ec2_instance_id])
-                        if instances['Reservations'] and instances['Reservations'][0]['Instances']:
-                            instance = instances['Reservations'][0]['Instances'][0]
-                            public_ip = instance.get('PublicIpAddress')
-                            if public_ip:
-                                return f"http://{public_ip}:8000"
+                # awsvpc tasks serve on their task ENI, not the container
+                # instance's address
+                eni_id = self._task_eni_id(task_details['tasks'][0])
+                if eni_id:
+                    ip = self._eni_ips([eni_id]).get(eni_id)
+                    if ip:
+                        return f"http://{ip}:8000"
         
         # Fallback: Return a placeholder endpoint
         # In production, this would use Application Load Balancer or similar
         return f"https://nim-{instance_name}.{self.region}.aws.nim.api.nvidia.com"
     
+    def _describe_all_services(self) -> List[tuple]:
+        """
+        Describe every service in every cluster, fanned out over a thread pool.
+
+        list_clusters/list_services are paginated and describe_services is
+        batched at the AWS maximum of 10 names per call; the per-cluster
+        walks run concurrently since the work is purely network-bound.
+
+        Returns:
+            List of (cluster_name, service) tuples
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        cluster_paginator = self.ecs_client.get_paginator('list_clusters')
+        cluster_arns = [arn for page in cluster_paginator.paginate()
+                        for arn in page['clusterArns']]
+
+        def _cluster_services(cluster_arn):
+            cluster_name = cluster_arn.split('/')[-1]
+            service_paginator = self.ecs_client.get_paginator('list_services')
+            service_names = [arn.split('/')[-1]
+                             for page in service_paginator.paginate(cluster=cluster_name)
+                             for arn in page['serviceArns']]
+            results = []
+            # describe_services accepts at most 10 services per call
+            for i in range(0, len(service_names), 10):
+                details = self.ecs_client.describe_services(
+                    cluster=cluster_name,
+                    services=service_names[i:i + 10]
+                )
+                results.extend((cluster_name, service) for service in details['services'])
+            return results
+
+        if not cluster_arns:
+            return []
+
+        all_services = []
+        with ThreadPoolExecutor(max_workers=min(16, len(cluster_arns))) as executor:
+            for services in executor.map(_cluster_services, cluster_arns):
+                all_services.extend(services)
+        return all_services
+
+    def _find_service(self, instance_name: str) -> tuple:
+        """Find a service by instance name, consulting the deployment index first"""
+        cached = self._deployment_index.get(instance_name)
+        if cached:
+            cluster_name, service_name = cached
+            details = self.ecs_client.describe_services(
+                cluster=cluster_name, services=[service_name]
+            )
+            if details['services']:
+                return cluster_name, details['services'][0]
+            # Stale entry (service deleted out-of-band) - fall through to scan
+            del self._deployment_index[instance_name]
+
+        for cluster_name, service in self._describe_all_services():
+            if instance_name in service['serviceName']:
+                self._deployment_index[instance_name] = (cluster_name, service['serviceName'])
+                return cluster_name, service
+        return None, None
+
+    def _batch_endpoint_urls(self, cluster_name: str, service_names: List[str]) -> Dict[str, str]:
+        """
+        Resolve endpoint URLs for many services in one batched pass.
+
+        Instead of a per-service lookup chain, this lists the cluster's
+        tasks once, maps each wanted service to its task ENI (awsvpc
+        tasks serve on the task ENI, not the container instance), and
+        resolves the ENI addresses in batched calls of up to 100 ids.
+
+        Returns:
+            Dict of service_name -> endpoint URL (services without a
+            running task or reachable IP are absent)
+        """
+        urls = {}
+        wanted = set(service_names)
+
+        task_paginator = self.ecs_client.get_paginator('list_tasks')
+        task_arns = [arn for page in task_paginator.paginate(cluster=cluster_name)
+                     for arn in page['taskArns']]
+        if not task_arns:
+            return urls
+
+        # Phase 1: map each wanted service to its task's ENI
+        service_to_eni = {}
+        for i in range(0, len(task_arns), 100):
+            details = self.ecs_client.describe_tasks(
+                cluster=cluster_name, tasks=task_arns[i:i + 100]
+            )
+            for task in details['tasks']:
+                group = task.get('group', '')
+                if not group.startswith('service:'):
+                    continue
+                service_name = group[len('service:'):]
+                if service_name in wanted and service_name not in service_to_eni:
+                    eni_id = self._task_eni_id(task)
+                    if eni_id:
+                        service_to_eni[service_name] = eni_id
+        if not service_to_eni:
+            return urls
+
+        # Phase 2: one batched ENI lookup, then fan the IPs back out
+        eni_to_ip = self._eni_ips(list(set(service_to_eni.values())))
+        for service_name, eni_id in service_to_eni.items():
+            ip = eni_to_ip.get(eni_id)
+            if ip:
+                urls[service_name] = f"http://{ip}:8000"
+        return urls
+
     def get_deployment_status(self, instance_name: str) -> Dict:
         """Get status of a deployed instance"""
         try:
-            # Find service by instance name
-            clusters = self.ecs_client.list_clusters()
-            for cluster_arn in clusters['clusterArns']:
-                cluster_name = cluster_arn.split('/')[-1]
-                services = self.ecs_client.list_services(cluster=cluster_name)
-                for service_arn in services['serviceArns']:
-                    service_name = service_arn.split('/')[-1]
-                    if instance_name in service_name:
-                        service_details = self.ecs_client.describe_services(
-                            cluster=cluster_name,
-                            services=[service_name]
-                        )
-                        if service_details['services']:
-                            service = service_details['services'][0]
-                            return {
-                                'status': service['status'],
-                                'runningCount': service['runningCount'],
-                                'desiredCount': service['desiredCount'],
-                                'endpoint': self._get_endpoint_url(service, instance_name)
-                            }
+            cluster_name, service = self._find_service(instance_name)
+            if service:
+                return {
+                    'status': service['status'],
+                    'runningCount': service['runningCount'],
+                    'desiredCount': service['desiredCount'],
+                    'endpoint': self._get_endpoint_url(service, instance_name, cluster_name)
+                }
         except Exception as e:
             logger.error(f"Error getting deployment status: {e}", exc_info=True)
-        
+
         return {'status': 'unknown', 'runningCount': 0, 'desiredCount': 0}
-    
+
     def list_deployments(self) -> List[Dict]:
         """List all deployed NIM instances"""
         deployments = []
-        
+
         try:
-            clusters = self.ecs_client.list_clusters()
-            for cluster_arn in clusters['clusterArns']:
-                cluster_name = cluster_arn.split('/')[-1]
-                services = self.ecs_client.list_services(cluster=cluster_name)
-                
-                for service_arn in services['serviceArns']:
-                    service_name = service_arn.split('/')[-1]
-                    if 'budgetguard' in service_name.lower() or 'nim' in service_name.lower():
-                        service_details = self.ecs_client.describe_services(
-                            cluster=cluster_name,
-                            services=[service_name]
-                        )
-                        if service_details['services']:
-                            service = service_details['services'][0]
-                            endpoint = self._get_endpoint_url(service, service_name)
-                            deployments.append({
-                                'instance_name': service_name,
-                                'cluster': cluster_name,
-                                'status': service['status'],
-                                'runningCount': service['runningCount'],
-                                'endpoint': endpoint,
-                                'provider': 'aws',
-                                'region': self.region
-                            })
+            services_by_cluster = {}
+            for cluster_name, service in self._describe_all_services():
+                service_name = service['serviceName']
+                if 'budgetguard' in service_name.lower() or 'nim' in service_name.lower():
+                    services_by_cluster.setdefault(cluster_name, []).append(service)
+
+            for cluster_name, services in services_by_cluster.items():
+                # One batched endpoint resolution per cluster
+                endpoint_map = self._batch_endpoint_urls(
+                    cluster_name, [s['serviceName'] for s in services]
+                )
+                for service in services:
+                    service_name = service['serviceName']
+                    endpoint = endpoint_map.get(service_name) or \
+                        f"https://nim-{service_name}.{self.region}.aws.nim.api.nvidia.com"
+                    deployments.append({
+                        'instance_name': service_name,
+                        'cluster': cluster_name,
+                        'status': service['status'],
+                        'runningCount': service['runningCount'],
+                        'endpoint': endpoint,
+                        'provider': 'aws',
+                        'region': self.region
+                    })
         except Exception as e:
             logger.error(f"Error listing deployments: {e}", exc_info=True)
-        
+
         return deployments
-    
+
     def start_deployment(self, instance_name: str) -> bool:
         """Start a stopped deployment (scale from 0 to 1)"""
         try:
-            clusters = self.ecs_client.list_clusters()
-            for cluster_arn in clusters['clusterArns']:
-                cluster_name = cluster_arn.split('/')[-1]
-                services = self.ecs_client.list_services(cluster=cluster_name)
-                for service_arn in services['serviceArns']:
-                    service_name = service_arn.split('/')[-1]
-                    if instance_name in service_name:
-                        self.ecs_client.update_service(
-                            cluster=cluster_name,
-                            service=service_name,
-                            desiredCount=1
-                        )
-                        logger.info(f"Started deployment: {instance_name}")
-                        return True
+            cluster_name, service = self._find_service(instance_name)
+            if service:
+                self.ecs_client.update_service(
+                    cluster=cluster_name,
+                    service=service['serviceName'],
+                    desiredCount=1
+                )
+                logger.info(f"Started deployment: {instance_name}")
+                return True
         except Exception as e:
             logger.error(f"Error starting deployment: {e}", exc_info=True)
-        
+
         return False
-    
+
     def stop_deployment(self, instance_name: str) -> bool:
         """Stop a deployed NIM instance"""
         try:
-            clusters = self.ecs_client.list_clusters()
-            for cluster_arn in clusters['clusterArns']:
-                cluster_name = cluster_arn.split('/')[-1]
-                services = self.ecs_client.list_services(cluster=cluster_name)
-                for service_arn in services['serviceArns']:
-                    service_name = service_arn.split('/')[-1]
-                    if instance_name in service_name:
-                        self.ecs_client.update_service(
-                            cluster=cluster_name,
-                            service=service_name,
-                            desiredCount=0
-                        )
-                        logger.info(f"Stopped deployment: {instance_name}")
-                        return True
+            cluster_name, service = self._find_service(instance_name)
+            if service:
+                self.ecs_client.update_service(
+                    cluster=cluster_name,
+                    service=service['serviceName'],
+                    desiredCount=0
+                )
+                logger.info(f"Stopped deployment: {instance_name}")
+                return True
         except Exception as e:
             logger.error(f"Error stopping deployment: {e}", exc_info=True)
-        
+
         return False
 
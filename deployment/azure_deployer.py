@@ -11,12 +11,20 @@ Phase 3.5: Migrated from Container Instances to AKS with GPU node pools.
 See PLATFORM_SELECTION_GPU_REQUIREMENTS.md for details.
 """
 
+import copy
+import functools
 import logging
+import os
+import re
+import threading
 import time
 import base64
+import urllib3
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 try:
     from azure.identity import DefaultAzureCredential, ClientSecretCredential
@@ -26,15 +34,20 @@ try:
         AgentPoolMode, AgentPoolType, ScaleSetPriority, ScaleSetEvictionPolicy,
         ManagedClusterLoadBalancerProfile, ManagedClusterLoadBalancerProfileManagedOutboundIPs,
         ManagedClusterServicePrincipalProfile, ContainerServiceLinuxProfile,
-        ContainerServiceSshConfiguration, ContainerServiceSshPublicKey
+        ContainerServiceSshConfiguration, ContainerServiceSshPublicKey,
+        ManagedClusterIngressProfile, ManagedClusterIngressProfileWebAppRouting
     )
     from azure.mgmt.resource import ResourceManagementClient
     from azure.core.exceptions import AzureError
-    from kubernetes import client, config
-    from kubernetes.client import V1Deployment, V1Service, V1ObjectMeta, V1PodSpec, \
-        V1Container, V1ContainerPort, V1ResourceRequirements, V1ServicePort, \
-        V1ServiceSpec, V1DeploymentSpec, V1PodTemplateSpec, V1LabelSelector, \
-        V1EnvVar, AppsV1Api, CoreV1Api
+    from kubernetes import client, watch
+    try:
+        # Node auto-provisioning (Karpenter) profile - only in newer SDKs
+        from azure.mgmt.containerservice.models import ManagedClusterNodeProvisioningProfile
+        HAS_NODE_PROVISIONING = True
+    except ImportError:
+        HAS_NODE_PROVISIONING = False
+    from kubernetes.client import V1Deployment, V1Service, V1DeleteOptions, \
+        AppsV1Api, CoreV1Api
     from kubernetes.client.rest import ApiException
 except ImportError as e:
     logger = logging.getLogger(__name__)
@@ -43,17 +56,159 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# libyaml C loader when compiled in (~10x the pure-Python parser),
+# pure-Python SafeLoader otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Label stamped on every Deployment/Service this module creates, so list
+# operations can use a server-side selector instead of name heuristics
+_MANAGED_BY_SELECTOR = "app.kubernetes.io/managed-by=budgetguard-nim"
+_MANAGED_BY_LABELS = {"app.kubernetes.io/managed-by": "budgetguard-nim"}
+
+# GPUs to request per pod by tier. a100/h100 tiers map to 8-GPU NVLink
+# VMs (ND96asr_v4 / ND96isr_H100_v5); giving the pod the whole NVLink
+# domain keeps tensor-parallel traffic on NVLink (~600 GB/s) instead of
+# cross-node PCIe/IB (25-100 GB/s)
+_GPU_COUNT_BY_TIER = {"a100": 8, "h100": 8}
+
+# GPU-capable Azure VM SKU families (NC/ND/NV GPU series, NG Radeon)
+_GPU_SKU_RE = re.compile(r'^Standard_(NC|ND|NV|NG)', re.IGNORECASE)
+
+# NIM node type -> container image
+_NIM_IMAGE_MAP = {
+    "FLUX Dev": "nvcr.io/nim/nim_flux_dev",
+    "FLUX Canny": "nvcr.io/nim/nim_flux_canny",
+    "FLUX Depth": "nvcr.io/nim/nim_flux_depth",
+    "FLUX Kontext": "nvcr.io/nim/nim_flux_kontext",
+    "SDXL": "nvcr.io/nim/nim_sdxl",
+    "Llama 3": "nvcr.io/nim/nim_llama3",
+    "Mixtral": "nvcr.io/nim/nim_mixtral",
+    "Phi-3": "nvcr.io/nim/nim_phi3"
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _nim_image_uri(node_type: str) -> str:
+    """Image URI for a node type, memoized so unknown types build their fallback string once"""
+    return _NIM_IMAGE_MAP.get(node_type) or \
+        f"nvcr.io/nim/nim_{node_type.lower().replace(' ', '_')}"
+
+# Manifest skeletons. The kubernetes client accepts plain dicts, which
+# skips the V1* model constructors' per-attribute validation reflection -
+# _create_k8s_deployment/_create_k8s_service deep-copy and fill these.
+_DEPLOYMENT_TEMPLATE = {
+    "apiVersion": "apps/v1",
+    "kind": "Deployment",
+    "metadata": {"name": None, "namespace": "default", "labels": None},
+    "spec": {
+        "replicas": 0,
+        "selector": {"matchLabels": None},
+        "template": {
+            "metadata": {"labels": None},
+            "spec": {
+                "nodeSelector": {"accelerator": "nvidia-gpu"},  # Select GPU nodes
+                "tolerations": [
+                    {
+                        "key": "nvidia.com/gpu",
+                        "operator": "Equal",
+                        "value": "true",
+                        "effect": "NoSchedule"
+                    }
+                ],
+                "containers": [
+                    {
+                        "name": None,
+                        "image": None,
+                        "ports": [{"containerPort": 8000, "protocol": "TCP"}],
+                        "env": [{"name": "NIM_MODEL", "value": None}],
+                        "resources": {
+                            "requests": {
+                                "nvidia.com/gpu": "1",
+                                "cpu": "2",  # 2 CPU cores
+                                "memory": "8Gi"  # 8 GB RAM
+                            },
+                            "limits": {
+                                "nvidia.com/gpu": "1",
+                                "cpu": "4",  # 4 CPU cores max
+                                "memory": "16Gi"  # 16 GB RAM max
+                            }
+                        }
+                    }
+                ]
+            }
+        }
+    }
+}
+
+_SERVICE_TEMPLATE = {
+    "apiVersion": "v1",
+    "kind": "Service",
+    "metadata": {"name": None, "namespace": "default", "labels": None},
+    "spec": {
+        "type": "ClusterIP",
+        "selector": None,
+        "ports": [{"port": 8000, "targetPort": 8000, "protocol": "TCP"}]
+    }
+}
+
+
+def _cache_dir() -> Path:
+    """Return (and create) the on-disk cache directory for slow ARM lookups"""
+    cache_dir = Path.home() / ".cache" / "budgetguard"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+class _CachingCredential:
+    """
+    Token-caching delegator around an azure-identity credential.
+
+    DefaultAzureCredential/ClientSecretCredential re-run the credential
+    chain on every get_token call, which costs hundreds of ms per ARM or
+    Kubernetes request. Memoize tokens per scope set until shortly before
+    expiry so the dozens of calls a deploy makes share one token fetch.
+    """
+
+    # Refresh this many seconds before the token actually expires
+    _REFRESH_MARGIN = 300
+
+    def __init__(self, credential):
+        self._credential = credential
+        self._tokens = {}  # tuple(scopes) -> AccessToken
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes, **kwargs):
+        key = tuple(scopes)
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None and time.time() < token.expires_on - self._REFRESH_MARGIN:
+                return token
+            token = self._credential.get_token(*scopes, **kwargs)
+            self._tokens[key] = token
+            return token
+
+    def close(self):
+        close = getattr(self._credential, 'close', None)
+        if close is not None:
+            close()
+
 
 class AzureDeployer:
     """Deploys NIM instances to Azure AKS (Azure Kubernetes Service) with GPU support"""
-    
-    def __init__(self, subscription_id: str, tenant_id: str = None, 
+
+    # How long a fetched ManagedCluster object stays fresh before the next
+    # deploy re-checks ARM
+    _CLUSTER_CACHE_TTL = 300.0
+
+
+    def __init__(self, subscription_id: str, tenant_id: str = None,
                  client_id: str = None, client_secret: str = None,
                  resource_group: str = None, region: str = 'eastus',
-                 gpu_vm_size: str = None):
+                 gpu_vm_size: str = None, node_auto_provisioning: bool = False,
+                 warm_gpu_nodes: int = 0):
         """
         Initialize Azure Deployer for AKS
-        
+
         Args:
             subscription_id: Azure Subscription ID
             tenant_id: Azure Tenant ID (optional, uses DefaultAzureCredential if not provided)
@@ -63,11 +218,22 @@ class AzureDeployer:
             region: Azure region (default: eastus)
             gpu_vm_size: GPU VM size for node pool (default: Standard_NC6s_v3 for T4/K80,
                         or Standard_ND96asr_v4 for A100 - recommended for SD/FLUX models)
+            node_auto_provisioning: Use AKS node auto-provisioning (Karpenter) instead
+                        of a static GPU node pool, so pod GPU requests drive VM SKU
+                        selection and nodes launch in parallel across SKUs
+            warm_gpu_nodes: Keep this many GPU nodes warm via a low-priority
+                        pause deployment that real NIM pods preempt, hiding the
+                        multi-minute GPU VM provisioning latency (0 = disabled)
         """
         self.subscription_id = subscription_id
         self.region = region
         self.resource_group = resource_group or "budgetguard-nim-rg"
         self.cluster_name = "budgetguard-nim-aks"
+        self.node_auto_provisioning = node_auto_provisioning and HAS_NODE_PROVISIONING
+        if node_auto_provisioning and not HAS_NODE_PROVISIONING:
+            logger.warning("azure-mgmt-containerservice too old for node auto-provisioning; "
+                           "falling back to a static GPU node pool")
+        self.warm_gpu_nodes = warm_gpu_nodes
         
         # Default GPU VM size (can be overridden)
         # NC6s_v3: 6 vCPU, 112 GB RAM, 1x NVIDIA K80 GPU (older, cheaper)
@@ -92,7 +258,11 @@ class AzureDeployer:
         else:
             # Use DefaultAzureCredential (works with Azure CLI, Managed Identity, etc.)
             self.credential = DefaultAzureCredential()
-        
+
+        # Cache tokens in-process so every ARM/AKS call doesn't re-run the
+        # credential chain
+        self.credential = _CachingCredential(self.credential)
+
         # Initialize Azure AKS client
         self.aks_client = ContainerServiceClient(
             self.credential,
@@ -109,14 +279,33 @@ class AzureDeployer:
         self.k8s_client = None
         self.k8s_apps_api = None
         self.k8s_core_api = None
+        self.k8s_networking_api = None
+
+        # External IP of the shared ingress - resolved once, then every
+        # endpoint URL is known synchronously
+        self._ingress_ip = None
+
+        # Cluster object + kubeconfig caches so back-to-back deploys don't
+        # repeat the managed_clusters.get / list_cluster_admin_credentials
+        # ARM round-trips
+        self._cluster_cache = None
+        self._cluster_cache_ts = 0.0
+        self._kubeconfig_cache = None
         
         logger.info(f"Azure AKS Deployer initialized for region: {region}, resource group: {resource_group}, GPU VM size: {self.gpu_vm_size}")
-        
-        # Ensure resource group exists
-        self._ensure_resource_group()
-    
+
+        # Resource group is ensured lazily on the first deploy, keeping the
+        # constructor free of ARM round-trips
+        self._rg_ensured = False
+
     def _ensure_resource_group(self):
-        """Ensure resource group exists"""
+        """Ensure resource group exists (skipped once a local marker confirms it)"""
+        # A marker file records that this (resource group, subscription) was
+        # already verified, so restarted processes skip the ARM GET too
+        marker = _cache_dir() / f"rg-{self.resource_group}-{self.subscription_id}"
+        if marker.exists():
+            return
+
         try:
             # Check if resource group exists
             try:
@@ -130,6 +319,7 @@ class AzureDeployer:
                     {"location": self.region}
                 )
                 logger.info(f"Resource group {self.resource_group} created")
+            marker.touch()
         except Exception as e:
             logger.warning(f"Could not ensure resource group exists: {e}")
     
@@ -159,17 +349,31 @@ class AzureDeployer:
             
             # Step 2: Initialize Kubernetes client
             self._initialize_k8s_client(cluster)
-            
+
+            # Step 2.5: With node auto-provisioning, install the Karpenter
+            # NodePool that tells it how to satisfy GPU pod requests
+            if self.node_auto_provisioning:
+                self._ensure_karpenter_nodepool()
+
+            # Step 2.6: Keep warm GPU capacity if configured
+            if self.warm_gpu_nodes > 0:
+                self._ensure_gpu_warmer()
+
             # Step 3: Get NVIDIA NIM container image
             image_uri = self._get_nim_image_uri(node_type)
-            
+
+            # Step 3.5: Pre-pull the image on GPU nodes so scale-up doesn't
+            # sit behind a multi-GB registry pull
+            self._ensure_image_prepuller(node_type, image_uri)
+
             # Step 4: Create Kubernetes deployment with GPU resources
             deployment = self._create_k8s_deployment(
-                instance_name, node_type, image_uri, scale_to_zero
+                instance_name, node_type, image_uri, scale_to_zero, gpu_tier
             )
             
-            # Step 5: Create Kubernetes service (LoadBalancer) for endpoint access
+            # Step 5: Create Kubernetes service + ingress rule for endpoint access
             service = self._create_k8s_service(instance_name)
+            self._create_k8s_ingress(instance_name)
             
             # Step 6: Wait for deployment to be ready (if not scale_to_zero)
             if not scale_to_zero:
@@ -186,7 +390,7 @@ class AzureDeployer:
                 "resource_group": self.resource_group,
                 "cluster": self.cluster_name,
                 "endpoint": endpoint_url,
-                "deployed_at": datetime.utcnow().isoformat() + "Z",
+                "deployed_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
                 "status": "stopped" if scale_to_zero else "running",
                 "gpu_vm_size": self.gpu_vm_size,
                 "gpu_tier": gpu_tier
@@ -201,7 +405,23 @@ class AzureDeployer:
     
     def _get_or_create_aks_cluster(self) -> ManagedCluster:
         """Get existing AKS cluster or create new one with GPU node pool"""
-        try:
+        # Serve the cached cluster while fresh - deploying 8 NIM variants
+        # costs one managed_clusters.get instead of 8
+        if (self._cluster_cache is not None
+                and time.time() - self._cluster_cache_ts < self._CLUSTER_CACHE_TTL):
+            return self._cluster_cache
+
+        # Deferred from __init__ so constructing a deployer costs no ARM calls
+        if not self._rg_ensured:
+            self._ensure_resource_group()
+            self._rg_ensured = True
+
+        # The existence check (ARM GET) and the service principal lookup are
+        # independent round-trips - overlap them so the create path doesn't
+        # pay their latencies in series
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sp_future = executor.submit(self._get_or_create_service_principal)
+
             # Check if cluster exists
             try:
                 cluster = self.aks_client.managed_clusters.get(
@@ -209,21 +429,24 @@ class AzureDeployer:
                     self.cluster_name
                 )
                 logger.info(f"Using existing AKS cluster: {self.cluster_name}")
-                
-                # Check if GPU node pool exists
-                if not self._has_gpu_node_pool(cluster):
+
+                # Check if GPU node pool exists (auto-provisioning clusters
+                # launch GPU nodes on demand instead of holding a pool)
+                if not self.node_auto_provisioning and not self._has_gpu_node_pool(cluster):
                     logger.info("GPU node pool not found, creating...")
                     self._create_gpu_node_pool(cluster)
-                
+
+                self._cluster_cache = cluster
+                self._cluster_cache_ts = time.time()
                 return cluster
             except AzureError:
                 pass  # Cluster doesn't exist, create it
-        
-        # Create new AKS cluster with GPU node pool
-        logger.info(f"Creating new AKS cluster: {self.cluster_name} with GPU node pool")
-        
-        # Get or create service principal for AKS
-        service_principal = self._get_or_create_service_principal()
+
+            # Create new AKS cluster with GPU node pool
+            logger.info(f"Creating new AKS cluster: {self.cluster_name} with GPU node pool")
+
+            # Service principal lookup was started alongside the existence check
+            service_principal = sp_future.result()
         
         # Create AKS cluster configuration
         # Note: Service principal is required for AKS. If not provided, AKS will create one automatically
@@ -261,20 +484,31 @@ class AzureDeployer:
                 type=AgentPoolType.VIRTUAL_MACHINE_SCALE_SETS,
                 min_count=1,
                 max_count=3
-            ),
-            # GPU node pool
-            ManagedClusterAgentPoolProfile(
-                name="gpunodepool",
-                count=0,  # Start with 0 nodes (scale-to-zero)
-                vm_size=self.gpu_vm_size,  # GPU instance
-                os_type="Linux",
-                mode=AgentPoolMode.USER,
-                type=AgentPoolType.VIRTUAL_MACHINE_SCALE_SETS,
-                min_count=0,  # Allow scale-to-zero
-                max_count=10,  # Max nodes for manual scaling
-                node_taints=["nvidia.com/gpu=true:NoSchedule"]  # Taint to require GPU workloads
             )
         ]
+
+        if self.node_auto_provisioning:
+            # Karpenter-based node auto-provisioning: pod GPU requests drive
+            # VM SKU selection and nodes launch in parallel across SKUs, so
+            # no static GPU pool (or its VMSS scale-up latency) is needed
+            cluster_config['node_provisioning_profile'] = \
+                ManagedClusterNodeProvisioningProfile(mode="Auto")
+        else:
+            # Static GPU node pool
+            cluster_config['agent_pool_profiles'].append(
+                ManagedClusterAgentPoolProfile(
+                    name="gpunodepool",
+                    count=0,  # Start with 0 nodes (scale-to-zero)
+                    vm_size=self.gpu_vm_size,  # GPU instance
+                    os_type="Linux",
+                    mode=AgentPoolMode.USER,
+                    type=AgentPoolType.VIRTUAL_MACHINE_SCALE_SETS,
+                    min_count=0,  # Allow scale-to-zero
+                    max_count=10,  # Max nodes for manual scaling
+                    node_taints=["nvidia.com/gpu=true:NoSchedule"],  # Taint to require GPU workloads
+                    node_labels=self._gpu_node_labels()
+                )
+            )
         
         # Add load balancer profile
         cluster_config['load_balancer_profile'] = ManagedClusterLoadBalancerProfile(
@@ -282,29 +516,73 @@ class AzureDeployer:
                 count=1
             )
         )
+
+        # Managed NGINX ingress (app routing add-on) - one shared LB/IP
+        # fronts every NIM instance instead of one LB per Service
+        cluster_config['ingress_profile'] = ManagedClusterIngressProfile(
+            web_app_routing=ManagedClusterIngressProfileWebAppRouting(enabled=True)
+        )
         
         cluster = ManagedCluster(**cluster_config)
-        
-        # Create cluster (this takes 10-15 minutes)
-        logger.info(f"Creating AKS cluster (this may take 10-15 minutes)...")
-        poller = self.aks_client.managed_clusters.begin_create_or_update(
-            self.resource_group,
-            self.cluster_name,
-            cluster
-        )
+
+        # Re-attach to a create that a previous process already started -
+        # the LRO continuation token is persisted below, so a crash or
+        # restart mid-create resumes the wait instead of redoing the work
+        lro_file = _cache_dir() / f"lro-{self.cluster_name}"
+        poller = None
+        if lro_file.exists():
+            try:
+                poller = self.aks_client.managed_clusters.begin_create_or_update(
+                    self.resource_group,
+                    self.cluster_name,
+                    cluster,
+                    continuation_token=lro_file.read_text()
+                )
+                logger.info(f"Resuming in-progress creation of AKS cluster {self.cluster_name}")
+            except Exception as e:
+                logger.warning(f"Could not resume cluster creation, starting fresh: {e}")
+                poller = None
+
+        if poller is None:
+            # Create cluster (this takes 10-15 minutes)
+            logger.info(f"Creating AKS cluster (this may take 10-15 minutes)...")
+            poller = self.aks_client.managed_clusters.begin_create_or_update(
+                self.resource_group,
+                self.cluster_name,
+                cluster
+            )
+            # Persist the token immediately - from here on the operation is
+            # resumable by any process
+            try:
+                lro_file.write_text(poller.continuation_token())
+            except Exception as e:
+                logger.warning(f"Could not persist LRO continuation token: {e}")
+
         cluster = poller.result()
-        
+        lro_file.unlink(missing_ok=True)
+
         logger.info(f"AKS cluster {self.cluster_name} created successfully")
+        self._cluster_cache = cluster
+        self._cluster_cache_ts = time.time()
         return cluster
     
+    def _gpu_node_labels(self) -> Dict:
+        """
+        Node labels for the GPU pool.
+
+        The accelerator label is what the NIM pod specs select on; the
+        nvlink.domain label (keyed by VM SKU) marks which nodes share an
+        NVLink topology so pod affinity can colocate multi-GPU workloads.
+        """
+        return {
+            "accelerator": "nvidia-gpu",
+            "nvlink.domain": self.gpu_vm_size.lower()
+        }
+
     def _has_gpu_node_pool(self, cluster: ManagedCluster) -> bool:
         """Check if cluster has a GPU node pool"""
-        if not cluster.agent_pool_profiles:
-            return False
-        for pool in cluster.agent_pool_profiles:
-            if 'gpu' in pool.name.lower() or 'nc' in pool.vm_size.lower() or 'nd' in pool.vm_size.lower():
-                return True
-        return False
+        return any('gpu' in pool.name.lower() or _GPU_SKU_RE.match(pool.vm_size)
+                   for pool in (cluster.agent_pool_profiles or ()))
     
     def _create_gpu_node_pool(self, cluster: ManagedCluster):
         """Create GPU node pool in existing cluster"""
@@ -319,7 +597,8 @@ class AzureDeployer:
             type=AgentPoolType.VIRTUAL_MACHINE_SCALE_SETS,
             min_count=0,
             max_count=10,
-            node_taints=["nvidia.com/gpu=true:NoSchedule"]
+            node_taints=["nvidia.com/gpu=true:NoSchedule"],
+            node_labels=self._gpu_node_labels()
         )
         
         poller = self.aks_client.agent_pools.begin_create_or_update(
@@ -348,34 +627,97 @@ class AzureDeployer:
             'client_secret': 'placeholder'
         }
     
+    def _get_kubeconfig_yaml(self) -> str:
+        """
+        Fetch the cluster kubeconfig, cached in memory and on disk.
+
+        list_cluster_admin_credentials is a privileged ARM POST costing
+        400-700ms; the in-memory cache covers repeat deploys in-process and
+        the on-disk copy (mode 0600) covers restarted processes.
+        """
+        if self._kubeconfig_cache is not None:
+            return self._kubeconfig_cache
+
+        kubeconfig_file = _cache_dir() / f"aks-{self.cluster_name}.kubeconfig"
+        if kubeconfig_file.exists():
+            self._kubeconfig_cache = kubeconfig_file.read_text()
+            return self._kubeconfig_cache
+
+        # Get AKS cluster admin credentials
+        creds = self.aks_client.managed_clusters.list_cluster_admin_credentials(
+            self.resource_group,
+            self.cluster_name
+        )
+
+        if not creds.kubeconfigs or len(creds.kubeconfigs) == 0:
+            raise Exception("No kubeconfig found in cluster credentials")
+
+        # Decode base64 kubeconfig
+        kubeconfig_yaml = base64.b64decode(creds.kubeconfigs[0].value).decode('utf-8')
+
+        try:
+            kubeconfig_file.write_text(kubeconfig_yaml)
+            kubeconfig_file.chmod(0o600)  # Credentials - restrict permissions
+        except OSError as e:
+            logger.warning(f"Could not persist kubeconfig cache: {e}")
+
+        self._kubeconfig_cache = kubeconfig_yaml
+        return kubeconfig_yaml
+
+    def _write_pem_cache(self, filename: str, pem_b64: str) -> str:
+        """Write base64 PEM material to the cache dir (mode 0600), returning its path"""
+        pem_path = _cache_dir() / f"aks-{self.cluster_name}-{filename}"
+        pem_path.write_bytes(base64.b64decode(pem_b64))
+        pem_path.chmod(0o600)  # Credentials - restrict permissions
+        return str(pem_path)
+
     def _initialize_k8s_client(self, cluster: ManagedCluster):
         """Initialize Kubernetes client using AKS cluster credentials"""
+        # Already initialized in this process - nothing to do
+        if self.k8s_apps_api is not None:
+            return
+
         try:
-            # Get AKS cluster admin credentials
-            creds = self.aks_client.managed_clusters.list_cluster_admin_credentials(
-                self.resource_group,
-                self.cluster_name
+            kubeconfig_yaml = self._get_kubeconfig_yaml()
+
+            # Parse once with the C loader and build the Configuration
+            # directly - skips load_kube_config_from_dict's dict walking
+            # and pure-Python YAML on the hot deploy path
+            kubeconfig_dict = yaml.load(kubeconfig_yaml, Loader=_YAML_LOADER)
+            cluster_entry = kubeconfig_dict['clusters'][0]['cluster']
+            user_entry = kubeconfig_dict['users'][0]['user']
+
+            cfg = client.Configuration()
+            cfg.host = cluster_entry['server']
+            if 'certificate-authority-data' in cluster_entry:
+                cfg.ssl_ca_cert = self._write_pem_cache(
+                    'ca.pem', cluster_entry['certificate-authority-data'])
+
+            # AKS admin kubeconfigs carry client certs; token auth is kept
+            # for other credential shapes
+            if 'client-certificate-data' in user_entry:
+                cfg.cert_file = self._write_pem_cache(
+                    'cert.pem', user_entry['client-certificate-data'])
+                cfg.key_file = self._write_pem_cache(
+                    'key.pem', user_entry['client-key-data'])
+            elif 'token' in user_entry:
+                cfg.api_key['authorization'] = f"Bearer {user_entry['token']}"
+
+            # Size the urllib3 pool for burst deploys and retry transient
+            # API-server errors. The default pool (maxsize=4) re-handshakes
+            # TLS per request once concurrent deploy/list calls exceed it.
+            cfg.connection_pool_maxsize = 32
+            cfg.retries = urllib3.util.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504]
             )
-            
-            if not creds.kubeconfigs or len(creds.kubeconfigs) == 0:
-                raise Exception("No kubeconfig found in cluster credentials")
-            
-            # Extract kubeconfig from credentials
-            kubeconfig = creds.kubeconfigs[0].value
-            
-            # Decode base64 kubeconfig
-            kubeconfig_yaml = base64.b64decode(kubeconfig).decode('utf-8')
-            
-            # Parse kubeconfig YAML
-            kubeconfig_dict = yaml.safe_load(kubeconfig_yaml)
-            
-            # Load kubeconfig into Kubernetes client
-            config.load_kube_config_from_dict(kubeconfig_dict)
-            
-            # Initialize API clients
-            self.k8s_client = client.ApiClient()
-            self.k8s_apps_api = AppsV1Api()
-            self.k8s_core_api = CoreV1Api()
+
+            # Initialize API clients (one shared ApiClient, keep-alive pool)
+            self.k8s_client = client.ApiClient(cfg)
+            self.k8s_apps_api = AppsV1Api(self.k8s_client)
+            self.k8s_core_api = CoreV1Api(self.k8s_client)
+            self.k8s_networking_api = client.NetworkingV1Api(self.k8s_client)
             
             logger.info("Kubernetes client initialized successfully")
         except Exception as e:
@@ -384,85 +726,266 @@ class AzureDeployer:
     
     def _get_nim_image_uri(self, node_type: str) -> str:
         """Get container image URI for NIM node type"""
-        nim_image_map = {
-            "FLUX Dev": "nvcr.io/nim/nim_flux_dev",
-            "FLUX Canny": "nvcr.io/nim/nim_flux_canny",
-            "FLUX Depth": "nvcr.io/nim/nim_flux_depth",
-            "FLUX Kontext": "nvcr.io/nim/nim_flux_kontext",
-            "SDXL": "nvcr.io/nim/nim_sdxl",
-            "Llama 3": "nvcr.io/nim/nim_llama3",
-            "Mixtral": "nvcr.io/nim/nim_mixtral",
-            "Phi-3": "nvcr.io/nim/nim_phi3"
-        }
-        
-        return nim_image_map.get(node_type, f"nvcr.io/nim/nim_{node_type.lower().replace(' ', '_')}")
+        return _nim_image_uri(node_type)
     
-    def _create_k8s_deployment(self, instance_name: str, node_type: str,
-                               image_uri: str, scale_to_zero: bool) -> V1Deployment:
-        """Create Kubernetes deployment for NIM container with GPU resources"""
-        namespace = "default"
-        replicas = 0 if scale_to_zero else 1
-        
-        # Container with GPU resource requirements
-        container = V1Container(
-            name=instance_name,
-            image=image_uri,
-            ports=[V1ContainerPort(container_port=8000, protocol="TCP")],
-            env=[
-                V1EnvVar(name="NIM_MODEL", value=node_type)
-            ],
-            resources=V1ResourceRequirements(
-                requests={
-                    "nvidia.com/gpu": "1",  # Request 1 GPU
-                    "cpu": "2",  # 2 CPU cores
-                    "memory": "8Gi"  # 8 GB RAM
+    def _ensure_karpenter_nodepool(self):
+        """
+        Install the Karpenter NodePool for GPU workloads (auto-provisioning mode).
+
+        Constrains provisioning to N-series SKUs and applies the same
+        accelerator label/taint the NIM pod specs already target, so pods
+        schedule identically whether nodes come from the static pool or
+        from auto-provisioning.
+        """
+        nodepool = {
+            "apiVersion": "karpenter.sh/v1",
+            "kind": "NodePool",
+            "metadata": {
+                "name": "budgetguard-gpu",
+                "labels": dict(_MANAGED_BY_LABELS)
+            },
+            "spec": {
+                "template": {
+                    "metadata": {
+                        "labels": {"accelerator": "nvidia-gpu"}
+                    },
+                    "spec": {
+                        "requirements": [
+                            {
+                                "key": "karpenter.azure.com/sku-family",
+                                "operator": "In",
+                                "values": ["N"]
+                            }
+                        ],
+                        "taints": [
+                            {
+                                "key": "nvidia.com/gpu",
+                                "value": "true",
+                                "effect": "NoSchedule"
+                            }
+                        ],
+                        "nodeClassRef": {
+                            "group": "karpenter.azure.com",
+                            "kind": "AKSNodeClass",
+                            "name": "default"
+                        }
+                    }
                 },
-                limits={
-                    "nvidia.com/gpu": "1",  # Limit to 1 GPU
-                    "cpu": "4",  # 4 CPU cores max
-                    "memory": "16Gi"  # 16 GB RAM max
+                "disruption": {
+                    "consolidationPolicy": "WhenEmpty",
+                    "consolidateAfter": "60s"
                 }
+            }
+        }
+
+        try:
+            client.CustomObjectsApi(self.k8s_client).create_cluster_custom_object(
+                group="karpenter.sh",
+                version="v1",
+                plural="nodepools",
+                body=nodepool
             )
-        )
-        
-        # Pod template with node selector for GPU nodes
-        pod_template = V1PodTemplateSpec(
-            metadata=V1ObjectMeta(
-                labels={"app": instance_name}
-            ),
-            spec=V1PodSpec(
-                containers=[container],
-                node_selector={
-                    "accelerator": "nvidia-gpu"  # Select GPU nodes
-                },
-                tolerations=[
-                    {
-                        "key": "nvidia.com/gpu",
-                        "operator": "Equal",
-                        "value": "true",
-                        "effect": "NoSchedule"
+            logger.info("Created Karpenter NodePool: budgetguard-gpu")
+        except ApiException as e:
+            if e.status == 409:  # Already exists
+                return
+            logger.warning(f"Could not create Karpenter NodePool: {e}")
+
+    def _ensure_gpu_warmer(self):
+        """
+        Keep warm_gpu_nodes GPU nodes provisioned via a preemptible filler.
+
+        A negative-priority pause Deployment holds one GPU per replica, so
+        the autoscaler keeps that many GPU nodes up (drivers installed,
+        images pre-pulled). Real NIM pods run at default priority (0) and
+        preempt the fillers instantly, hiding the multi-minute GPU VM
+        provisioning latency.
+        """
+        priority_class = {
+            "apiVersion": "scheduling.k8s.io/v1",
+            "kind": "PriorityClass",
+            "metadata": {"name": "gpu-warmer", "labels": dict(_MANAGED_BY_LABELS)},
+            "value": -10,
+            "globalDefault": False,
+            "description": "Preemptible filler pods that keep GPU nodes warm"
+        }
+
+        warmer = {
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {
+                "name": "gpu-warmer",
+                "namespace": "default",
+                "labels": dict(_MANAGED_BY_LABELS)
+            },
+            "spec": {
+                "replicas": self.warm_gpu_nodes,
+                "selector": {"matchLabels": {"app": "gpu-warmer"}},
+                "template": {
+                    "metadata": {"labels": {"app": "gpu-warmer"}},
+                    "spec": {
+                        "priorityClassName": "gpu-warmer",
+                        "nodeSelector": {"accelerator": "nvidia-gpu"},
+                        "tolerations": [
+                            {
+                                "key": "nvidia.com/gpu",
+                                "operator": "Equal",
+                                "value": "true",
+                                "effect": "NoSchedule"
+                            }
+                        ],
+                        "containers": [
+                            {
+                                "name": "pause",
+                                "image": "registry.k8s.io/pause:3.9",
+                                "resources": {
+                                    "requests": {"nvidia.com/gpu": "1"},
+                                    "limits": {"nvidia.com/gpu": "1"}
+                                }
+                            }
+                        ]
                     }
-                ]
+                }
+            }
+        }
+
+        try:
+            client.SchedulingV1Api(self.k8s_client).create_priority_class(
+                body=priority_class
             )
-        )
-        
-        # Deployment
-        deployment = V1Deployment(
-            api_version="apps/v1",
-            kind="Deployment",
-            metadata=V1ObjectMeta(
-                name=instance_name,
-                namespace=namespace
-            ),
-            spec=V1DeploymentSpec(
-                replicas=replicas,
-                selector=V1LabelSelector(
-                    match_labels={"app": instance_name}
-                ),
-                template=pod_template
+        except ApiException as e:
+            if e.status != 409:  # Already exists is fine
+                logger.warning(f"Could not create gpu-warmer PriorityClass: {e}")
+                return
+
+        try:
+            self.k8s_apps_api.create_namespaced_deployment(
+                namespace="default",
+                body=warmer
             )
-        )
-        
+            logger.info(f"Created gpu-warmer keeping {self.warm_gpu_nodes} GPU node(s) warm")
+        except ApiException as e:
+            if e.status == 409:
+                # Already exists - reconcile the warm node count
+                self.k8s_apps_api.patch_namespaced_deployment_scale(
+                    name="gpu-warmer",
+                    namespace="default",
+                    body={"spec": {"replicas": self.warm_gpu_nodes}}
+                )
+            else:
+                # Warming is an optimization, never a deploy blocker
+                logger.warning(f"Could not create gpu-warmer deployment: {e}")
+
+    def _ensure_image_prepuller(self, node_type: str, image_uri: str):
+        """
+        Create a DaemonSet that pre-pulls the NIM image on every GPU node.
+
+        The 10+ GB NIM image pull otherwise lands on the critical path the
+        first time a scale-to-zero deployment scales up. The DaemonSet runs
+        the image as an initContainer that exits immediately (warming the
+        node's image cache) and then parks on a pause container.
+        """
+        namespace = "default"
+        name = f"prepull-{node_type.lower().replace(' ', '-')}"
+
+        daemonset = {
+            "apiVersion": "apps/v1",
+            "kind": "DaemonSet",
+            "metadata": {
+                "name": name,
+                "namespace": namespace,
+                "labels": dict(_MANAGED_BY_LABELS)
+            },
+            "spec": {
+                "selector": {"matchLabels": {"app": name}},
+                "template": {
+                    "metadata": {"labels": {"app": name, **_MANAGED_BY_LABELS}},
+                    "spec": {
+                        "nodeSelector": {"accelerator": "nvidia-gpu"},
+                        "tolerations": [
+                            {
+                                "key": "nvidia.com/gpu",
+                                "operator": "Equal",
+                                "value": "true",
+                                "effect": "NoSchedule"
+                            }
+                        ],
+                        # Pulls the image, exits, leaves the layers cached
+                        "initContainers": [
+                            {
+                                "name": "prepull",
+                                "image": image_uri,
+                                "command": ["/bin/sh", "-c", "exit 0"]
+                            }
+                        ],
+                        "containers": [
+                            {
+                                "name": "pause",
+                                "image": "registry.k8s.io/pause:3.9",
+                                "resources": {
+                                    "requests": {"cpu": "10m", "memory": "16Mi"}
+                                }
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+
+        try:
+            self.k8s_apps_api.create_namespaced_daemon_set(
+                namespace=namespace,
+                body=daemonset
+            )
+            logger.info(f"Created image pre-pull DaemonSet: {name}")
+        except ApiException as e:
+            if e.status == 409:  # Already exists - image already warming
+                return
+            # Pre-pulling is an optimization, never a deploy blocker
+            logger.warning(f"Could not create pre-pull DaemonSet {name}: {e}")
+
+    def _create_k8s_deployment(self, instance_name: str, node_type: str,
+                               image_uri: str, scale_to_zero: bool,
+                               gpu_tier: str = None) -> V1Deployment:
+        """Create Kubernetes deployment for NIM container with GPU resources"""
+        namespace = "default"
+        labels = {"app": instance_name, **_MANAGED_BY_LABELS}
+
+        # Multi-GPU tiers get the whole NVLink domain (see _GPU_COUNT_BY_TIER)
+        gpu_count = str(_GPU_COUNT_BY_TIER.get((gpu_tier or '').lower(), 1))
+
+        deployment = copy.deepcopy(_DEPLOYMENT_TEMPLATE)
+        deployment["metadata"]["name"] = instance_name
+        deployment["metadata"]["labels"] = labels
+        spec = deployment["spec"]
+        spec["replicas"] = 0 if scale_to_zero else 1
+        spec["selector"]["matchLabels"] = {"app": instance_name}
+        spec["template"]["metadata"]["labels"] = dict(labels)
+
+        pod_spec = spec["template"]["spec"]
+        container = pod_spec["containers"][0]
+        container["name"] = instance_name
+        container["image"] = image_uri
+        container["env"][0]["value"] = node_type
+        container["resources"]["requests"]["nvidia.com/gpu"] = gpu_count
+        container["resources"]["limits"]["nvidia.com/gpu"] = gpu_count
+
+        # Multi-GPU tiers: require replicas to land in the same NVLink
+        # domain so tensor-parallel traffic stays on NVLink bandwidth
+        if (gpu_tier or '').lower() in _GPU_COUNT_BY_TIER:
+            pod_spec["affinity"] = {
+                "podAffinity": {
+                    "requiredDuringSchedulingIgnoredDuringExecution": [
+                        {
+                            "labelSelector": {
+                                "matchLabels": {"app": instance_name}
+                            },
+                            "topologyKey": "nvlink.domain"
+                        }
+                    ]
+                }
+            }
+
         # Create deployment
         try:
             result = self.k8s_apps_api.create_namespaced_deployment(
@@ -481,31 +1004,16 @@ class AzureDeployer:
                 )
                 return result
             raise
-    
+
     def _create_k8s_service(self, instance_name: str) -> V1Service:
-        """Create Kubernetes LoadBalancer service for endpoint access"""
+        """Create Kubernetes ClusterIP service, fronted by the shared ingress"""
         namespace = "default"
-        
-        service = V1Service(
-            api_version="v1",
-            kind="Service",
-            metadata=V1ObjectMeta(
-                name=instance_name,
-                namespace=namespace
-            ),
-            spec=V1ServiceSpec(
-                type="LoadBalancer",
-                selector={"app": instance_name},
-                ports=[
-                    V1ServicePort(
-                        port=8000,
-                        target_port=8000,
-                        protocol="TCP"
-                    )
-                ]
-            )
-        )
-        
+
+        service = copy.deepcopy(_SERVICE_TEMPLATE)
+        service["metadata"]["name"] = instance_name
+        service["metadata"]["labels"] = {"app": instance_name, **_MANAGED_BY_LABELS}
+        service["spec"]["selector"] = {"app": instance_name}
+
         # Create service
         try:
             result = self.k8s_core_api.create_namespaced_service(
@@ -523,61 +1031,169 @@ class AzureDeployer:
                 )
                 return result
             raise
-    
+
+    def _create_k8s_ingress(self, instance_name: str):
+        """Create the path-based ingress rule routing /nim/<instance> to the service"""
+        namespace = "default"
+
+        ingress = {
+            "apiVersion": "networking.k8s.io/v1",
+            "kind": "Ingress",
+            "metadata": {
+                "name": instance_name,
+                "namespace": namespace,
+                "labels": {"app": instance_name, **_MANAGED_BY_LABELS},
+                "annotations": {
+                    # Strip the /nim/<instance> prefix before proxying to NIM
+                    "nginx.ingress.kubernetes.io/use-regex": "true",
+                    "nginx.ingress.kubernetes.io/rewrite-target": "/$2"
+                }
+            },
+            "spec": {
+                "ingressClassName": "webapprouting.kubernetes.azure.com",
+                "rules": [
+                    {
+                        "http": {
+                            "paths": [
+                                {
+                                    "path": f"/nim/{instance_name}(/|$)(.*)",
+                                    "pathType": "ImplementationSpecific",
+                                    "backend": {
+                                        "service": {
+                                            "name": instance_name,
+                                            "port": {"number": 8000}
+                                        }
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                ]
+            }
+        }
+
+        try:
+            self.k8s_networking_api.create_namespaced_ingress(
+                namespace=namespace,
+                body=ingress
+            )
+            logger.info(f"Created ingress rule: /nim/{instance_name}")
+        except ApiException as e:
+            if e.status == 409:  # Already exists
+                logger.info(f"Ingress {instance_name} already exists")
+                return
+            raise
+
     def _wait_for_deployment_ready(self, instance_name: str, timeout: int = 300):
-        """Wait for Kubernetes deployment to be ready"""
+        """Wait for Kubernetes deployment to be ready (event-driven watch)"""
         logger.info(f"Waiting for deployment {instance_name} to be ready...")
-        start_time = time.time()
         namespace = "default"
-        
-        while time.time() - start_time < timeout:
-            try:
-                deployment = self.k8s_apps_api.read_namespaced_deployment(
-                    name=instance_name,
-                    namespace=namespace
-                )
-                
-                if deployment.status.ready_replicas and deployment.status.ready_replicas > 0:
+
+        try:
+            # Initial read doubles as the fast path and pins the
+            # resource_version the watch resumes from, so no event between
+            # read and watch is missed
+            deployment = self.k8s_apps_api.read_namespaced_deployment(
+                name=instance_name,
+                namespace=namespace
+            )
+            if deployment.status.ready_replicas:
+                logger.info(f"Deployment {instance_name} is ready")
+                return
+
+            # Watch instead of polling: the API server pushes status
+            # changes, so readiness is detected the moment it happens
+            # with a single long-lived request
+            w = watch.Watch()
+            for event in w.stream(
+                self.k8s_apps_api.list_namespaced_deployment,
+                namespace=namespace,
+                field_selector=f"metadata.name={instance_name}",
+                resource_version=deployment.metadata.resource_version,
+                timeout_seconds=timeout
+            ):
+                status = event['object'].status
+                if status and status.ready_replicas:
+                    w.stop()
                     logger.info(f"Deployment {instance_name} is ready")
                     return
-                
-                time.sleep(5)
-            except Exception as e:
-                logger.warning(f"Error checking deployment status: {e}")
-                time.sleep(5)
-        
+        except Exception as e:
+            logger.warning(f"Error watching deployment status: {e}")
+
         logger.warning(f"Deployment {instance_name} did not become ready within {timeout} seconds")
     
-    def _get_endpoint_url(self, instance_name: str) -> str:
-        """Get endpoint URL from LoadBalancer service"""
+    @staticmethod
+    def _service_endpoint(service) -> Optional[str]:
+        """Extract the endpoint URL from a Service's LoadBalancer status, if assigned"""
+        if service.status.load_balancer and service.status.load_balancer.ingress:
+            ingress = service.status.load_balancer.ingress[0]
+            ip_or_hostname = ingress.ip or ingress.hostname
+            if ip_or_hostname:
+                return f"http://{ip_or_hostname}:8000"
+        return None
+
+    def _resolve_ingress_ip(self, instance_name: str, timeout: int = 150) -> Optional[str]:
+        """
+        Resolve (and cache) the shared ingress external IP.
+
+        The IP is assigned once per cluster, so only the very first
+        deployment may have to watch for it; every later call returns the
+        cached value without touching the API server.
+        """
+        if self._ingress_ip:
+            return self._ingress_ip
+
         namespace = "default"
-        max_retries = 30
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                service = self.k8s_core_api.read_namespaced_service(
-                    name=instance_name,
-                    namespace=namespace
-                )
-                
-                if service.status.load_balancer and service.status.load_balancer.ingress:
-                    ingress = service.status.load_balancer.ingress[0]
-                    # Get IP or hostname from ingress
-                    ip_or_hostname = ingress.ip or ingress.hostname
-                    if ip_or_hostname:
-                        return f"http://{ip_or_hostname}:8000"
-                
-                # LoadBalancer IP not ready yet, wait
-                time.sleep(5)
-                retry_count += 1
-            except Exception as e:
-                logger.warning(f"Error getting service endpoint: {e}")
-                time.sleep(5)
-                retry_count += 1
-        
+        try:
+            # Initial read: fast path + resource_version pin for the watch
+            ingress = self.k8s_networking_api.read_namespaced_ingress(
+                name=instance_name,
+                namespace=namespace
+            )
+            if ingress.status.load_balancer and ingress.status.load_balancer.ingress:
+                self._ingress_ip = ingress.status.load_balancer.ingress[0].ip
+                return self._ingress_ip
+
+            # Watch until the ingress controller publishes its IP
+            w = watch.Watch()
+            for event in w.stream(
+                self.k8s_networking_api.list_namespaced_ingress,
+                namespace=namespace,
+                field_selector=f"metadata.name={instance_name}",
+                resource_version=ingress.metadata.resource_version,
+                timeout_seconds=timeout
+            ):
+                status = event['object'].status
+                if status.load_balancer and status.load_balancer.ingress:
+                    w.stop()
+                    self._ingress_ip = status.load_balancer.ingress[0].ip
+                    return self._ingress_ip
+        except Exception as e:
+            logger.warning(f"Error resolving ingress IP: {e}")
+
+        return None
+
+    def _get_endpoint_url(self, instance_name: str, timeout: int = 150) -> str:
+        """Get endpoint URL via the shared ingress (falls back to legacy LB services)"""
+        ingress_ip = self._resolve_ingress_ip(instance_name, timeout=timeout)
+        if ingress_ip:
+            return f"http://{ingress_ip}/nim/{instance_name}"
+
+        # Legacy path: instances deployed before the shared ingress still
+        # carry their own LoadBalancer service
+        try:
+            service = self.k8s_core_api.read_namespaced_service(
+                name=instance_name,
+                namespace="default"
+            )
+            endpoint = self._service_endpoint(service)
+            if endpoint:
+                return endpoint
+        except Exception as e:
+            logger.warning(f"Error getting service endpoint: {e}")
+
         # Fallback
-        logger.warning(f"Could not get LoadBalancer IP for {instance_name}, using placeholder")
+        logger.warning(f"Could not get endpoint for {instance_name}, using placeholder")
         return f"http://{instance_name}.{self.region}.cloudapp.azure.com:8000"
     
     def get_deployment_status(self, instance_name: str) -> Dict:
@@ -591,9 +1207,20 @@ class AzureDeployer:
             
             replicas = deployment.spec.replicas or 0
             ready_replicas = deployment.status.ready_replicas or 0
-            
-            endpoint = self._get_endpoint_url(instance_name)
-            
+
+            # Report whatever endpoint exists right now - a status query
+            # must not sit in the ingress-IP wait loop that deploys use
+            if self._ingress_ip:
+                endpoint = f"http://{self._ingress_ip}/nim/{instance_name}"
+            else:
+                try:
+                    service = self.k8s_core_api.read_namespaced_service(
+                        name=instance_name, namespace=namespace
+                    )
+                    endpoint = self._service_endpoint(service) or ''
+                except ApiException:
+                    endpoint = ''
+
             return {
                 'status': 'running' if ready_replicas > 0 else 'stopped',
                 'runningCount': ready_replicas,
@@ -604,93 +1231,206 @@ class AzureDeployer:
             logger.error(f"Error getting deployment status: {e}", exc_info=True)
             return {'status': 'unknown', 'runningCount': 0, 'desiredCount': 0}
     
+    def _build_deployment_row(self, deployment, service) -> Dict:
+        """Build a list_deployments row from already-listed Deployment/Service objects"""
+        replicas = deployment.spec.replicas or 0
+        ready_replicas = deployment.status.ready_replicas or 0
+
+        # Report whatever endpoint exists right now - listing never waits
+        # for an LB IP to be assigned
+        if self._ingress_ip:
+            endpoint = f"http://{self._ingress_ip}/nim/{deployment.metadata.name}"
+        elif service is not None:
+            endpoint = self._service_endpoint(service) or ''
+        else:
+            endpoint = ''
+
+        return {
+            'instance_name': deployment.metadata.name,
+            'status': 'running' if ready_replicas > 0 else 'stopped',
+            'runningCount': ready_replicas,
+            'desiredCount': replicas,
+            'endpoint': endpoint,
+            'provider': 'azure',
+            'region': self.region,
+            'resource_group': self.resource_group,
+            'cluster': self.cluster_name
+        }
+
     def list_deployments(self) -> List[Dict]:
         """List all deployed NIM instances"""
         deployments = []
         namespace = "default"
-        
+
         try:
-            all_deployments = self.k8s_apps_api.list_namespaced_deployment(namespace=namespace)
-            
-            for deployment in all_deployments.items:
-                if 'nim-' in deployment.metadata.name.lower():
-                    status = self.get_deployment_status(deployment.metadata.name)
-                    deployments.append({
-                        'instance_name': deployment.metadata.name,
-                        'status': status.get('status', 'unknown'),
-                        'runningCount': status.get('runningCount', 0),
-                        'endpoint': status.get('endpoint', ''),
-                        'provider': 'azure',
-                        'region': self.region,
-                        'resource_group': self.resource_group,
-                        'cluster': self.cluster_name
-                    })
+            # Two selector-scoped list calls (run concurrently), then join
+            # locally by name - no per-deployment reads, so listing N
+            # instances costs 2 round-trips instead of 1 + 2N
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                deployments_future = executor.submit(
+                    self.k8s_apps_api.list_namespaced_deployment,
+                    namespace=namespace,
+                    label_selector=_MANAGED_BY_SELECTOR
+                )
+                services_future = executor.submit(
+                    self.k8s_core_api.list_namespaced_service,
+                    namespace=namespace,
+                    label_selector=_MANAGED_BY_SELECTOR
+                )
+                nim_deployments = deployments_future.result().items
+                services_by_name = {s.metadata.name: s
+                                    for s in services_future.result().items}
+
+            deployments = [
+                self._build_deployment_row(d, services_by_name.get(d.metadata.name))
+                for d in nim_deployments
+            ]
         except Exception as e:
             logger.error(f"Error listing deployments: {e}", exc_info=True)
-        
+
         return deployments
     
+    def _scale(self, instance_name: str, replicas: int):
+        """
+        Scale a deployment via server-side apply on its scale subresource.
+
+        An apply patch owning only spec.replicas (fieldManager=budgetguard)
+        skips strategic-merge conflict resolution and the server-side
+        read-before-write of a regular scale patch - one small PATCH in,
+        one small Scale object out.
+        """
+        self.k8s_client.call_api(
+            '/apis/apps/v1/namespaces/{namespace}/deployments/{name}/scale',
+            'PATCH',
+            path_params={'namespace': 'default', 'name': instance_name},
+            query_params=[('fieldManager', 'budgetguard'), ('force', 'true')],
+            header_params={'Content-Type': 'application/apply-patch+yaml',
+                           'Accept': 'application/json'},
+            body={
+                'apiVersion': 'autoscaling/v1',
+                'kind': 'Scale',
+                'metadata': {'name': instance_name, 'namespace': 'default'},
+                'spec': {'replicas': replicas}
+            },
+            response_type='V1Scale',
+            auth_settings=['BearerToken'],
+            _return_http_data_only=True
+        )
+
     def start_deployment(self, instance_name: str) -> bool:
         """Start a stopped deployment by scaling to 1 replica"""
-        namespace = "default"
         try:
-            # Get current deployment
-            deployment = self.k8s_apps_api.read_namespaced_deployment(
-                name=instance_name,
-                namespace=namespace
-            )
-            
-            # Scale to 1 replica
-            deployment.spec.replicas = 1
-            
-            self.k8s_apps_api.patch_namespaced_deployment_scale(
-                name=instance_name,
-                namespace=namespace,
-                body={"spec": {"replicas": 1}}
-            )
-            
+            self._scale(instance_name, 1)
             logger.info(f"Started deployment: {instance_name}")
             return True
         except Exception as e:
             logger.error(f"Error starting deployment: {e}", exc_info=True)
             return False
-    
+
     def stop_deployment(self, instance_name: str) -> bool:
         """Stop a deployed NIM instance by scaling to 0 replicas"""
-        namespace = "default"
         try:
-            # Scale to 0 replicas
-            self.k8s_apps_api.patch_namespaced_deployment_scale(
-                name=instance_name,
-                namespace=namespace,
-                body={"spec": {"replicas": 0}}
-            )
-            
+            self._scale(instance_name, 0)
             logger.info(f"Stopped deployment: {instance_name}")
             return True
         except Exception as e:
             logger.error(f"Error stopping deployment: {e}", exc_info=True)
             return False
     
+    def stop_all_deployments(self) -> int:
+        """
+        Stop every NIM instance (end-of-day shutdown).
+
+        One selector-scoped list finds the fleet, then the scale patches go
+        out concurrently with a bounded pool and a single retry on 429, so
+        stopping N instances costs ~1 RTT instead of N sequential ones.
+
+        Returns:
+            Number of instances successfully scaled to 0
+        """
+        namespace = "default"
+        try:
+            nim_deployments = self.k8s_apps_api.list_namespaced_deployment(
+                namespace=namespace,
+                label_selector=_MANAGED_BY_SELECTOR
+            ).items
+        except Exception as e:
+            logger.error(f"Error listing deployments to stop: {e}", exc_info=True)
+            return 0
+
+        # Only patch instances that are actually running
+        to_stop = [d.metadata.name for d in nim_deployments if d.spec.replicas]
+        if not to_stop:
+            return 0
+
+        def _stop_one(name):
+            try:
+                self._scale(name, 0)
+            except ApiException as e:
+                if e.status != 429:
+                    raise
+                # Rate-limited - back off once and retry
+                time.sleep(1)
+                self._scale(name, 0)
+
+        stopped = 0
+        with ThreadPoolExecutor(max_workers=min(8, len(to_stop))) as executor:
+            futures = {name: executor.submit(_stop_one, name) for name in to_stop}
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    stopped += 1
+                except Exception as e:
+                    logger.error(f"Error stopping deployment {name}: {e}", exc_info=True)
+
+        logger.info(f"Stopped {stopped}/{len(to_stop)} deployment(s)")
+        return stopped
+
     def delete_deployment(self, instance_name: str) -> bool:
         """Delete a deployed NIM instance"""
         namespace = "default"
-        try:
-            # Delete deployment
-            self.k8s_apps_api.delete_namespaced_deployment(
+
+        # Foreground propagation reaps the ReplicaSet/Pods (and their GPU)
+        # before the delete returns, so the next deploy can claim the GPU
+        # immediately instead of racing orphaned pods
+        delete_options = V1DeleteOptions(
+            propagation_policy="Foreground",
+            grace_period_seconds=0
+        )
+
+        def _delete_service():
+            self.k8s_core_api.delete_namespaced_service(
                 name=instance_name,
                 namespace=namespace
             )
-            
-            # Delete service
-            try:
-                self.k8s_core_api.delete_namespaced_service(
+
+        def _delete_ingress():
+            self.k8s_networking_api.delete_namespaced_ingress(
+                name=instance_name,
+                namespace=namespace
+            )
+
+        try:
+            # Fire the three deletions concurrently - wall clock is the
+            # slowest one (the foreground deployment delete) instead of
+            # the sum
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                deployment_future = executor.submit(
+                    self.k8s_apps_api.delete_namespaced_deployment,
                     name=instance_name,
-                    namespace=namespace
+                    namespace=namespace,
+                    body=delete_options
                 )
-            except:
-                pass  # Service may not exist
-            
+                side_futures = [executor.submit(_delete_service),
+                                executor.submit(_delete_ingress)]
+
+                deployment_future.result()
+                for future in side_futures:
+                    try:
+                        future.result()
+                    except ApiException:
+                        pass  # Service/ingress may not exist
+
             logger.info(f"Deleted deployment: {instance_name}")
             return True
         except Exception as e:
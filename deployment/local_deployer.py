@@ -5,9 +5,12 @@ Handles deployment of NVIDIA NIM instances to localhost (Docker)
 """
 
 import logging
+import os
 import subprocess
 import time
 import json
+import yaml
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +18,15 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+# Cap on concurrent image pulls (mirrors compose's COMPOSE_PARALLEL_LIMIT knob)
+_PULL_LIMIT = int(os.environ.get("COMPOSE_PARALLEL_LIMIT", "5"))
+
+# libyaml-backed loader/dumper when the C extension is present (~10x the
+# pure-Python tokenizer); the pure-Python classes otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
 class LocalDeployer:
     """Deploys NIM instances locally using Docker"""
     
@@ -28,7 +40,12 @@ class LocalDeployer:
         self.docker_compose_path = docker_compose_path or Path.home() / ".budgetguard_techops" / "docker-compose.yml"
         self.docker_compose_path = Path(self.docker_compose_path)
         self.docker_compose_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        # Parsed compose file, invalidated by mtime so external edits
+        # are still picked up (see _load_compose)
+        self._compose_cache = None
+        self._compose_mtime = -1
+
         logger.info(f"Local Deployer initialized with docker-compose: {self.docker_compose_path}")
     
     def deploy_nim_instance(self, node_type: str, instance_name: str = None) -> Dict:
@@ -82,7 +99,62 @@ class LocalDeployer:
         except Exception as e:
             logger.error(f"Failed to deploy {node_type} locally: {e}", exc_info=True)
             raise
-    
+
+    def deploy_many(self, node_types: list) -> list:
+        """
+        Deploy several NIM instances in one pass.
+
+        All services are written to docker-compose.yml first, then every
+        image is pulled in one parallel compose pull - the multi-GB layer
+        downloads overlap across images, so total pull time is bounded by
+        network bandwidth instead of the sum of sequential pulls.
+
+        Args:
+            node_types: List of NIM node types to deploy
+
+        Returns:
+            List of deployment info dictionaries (as deploy_nim_instance)
+        """
+        if not self._check_docker():
+            raise Exception("Docker is not running. Please start Docker Desktop.")
+
+        instances = []
+        for node_type in node_types:
+            instance_name = f"nim-{node_type.lower().replace(' ', '-')}-local"
+            image_uri = self._get_nim_image_uri(node_type)
+            self._update_docker_compose(node_type, instance_name, image_uri)
+            instances.append((node_type, instance_name, image_uri))
+
+        # One compose pull fetches every service's image with overlapped
+        # downloads; fall back to the thread fan-out if this compose
+        # version doesn't support --parallel
+        try:
+            subprocess.run(
+                ["docker-compose", "-f", str(self.docker_compose_path), "pull", "--parallel"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=self.docker_compose_path.parent
+            )
+        except Exception as e:
+            logger.warning(f"Parallel compose pull unavailable ({e}), pulling directly")
+            self._pull_images([image_uri for _, _, image_uri in instances])
+
+        deployments = []
+        for node_type, instance_name, image_uri in instances:
+            self._start_container(instance_name)
+            deployments.append({
+                "node_type": node_type,
+                "instance_name": instance_name,
+                "provider": "local",
+                "endpoint": self._get_endpoint_url(instance_name),
+                "deployed_at": datetime.utcnow().isoformat() + "Z",
+                "status": "running"
+            })
+
+        logger.info(f"Successfully deployed {len(deployments)} instance(s) locally")
+        return deployments
+
     def _get_nim_image_uri(self, node_type: str) -> str:
         """Get Docker image URI for NIM node type"""
         # Map node types to NVIDIA NIM container images
@@ -113,29 +185,72 @@ class LocalDeployer:
             return False
     
     def _pull_image(self, image_uri: str):
-        """Pull Docker image"""
-        logger.info(f"Pulling Docker image: {image_uri}")
-        try:
-            subprocess.run(
-                ["docker", "pull", image_uri],
-                check=True,
-                capture_output=True
-            )
-            logger.info(f"Successfully pulled image: {image_uri}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to pull image: {e}")
-            raise Exception(f"Failed to pull Docker image: {image_uri}")
+        """Pull a single Docker image"""
+        self._pull_images([image_uri])
+
+    def _pull_images(self, image_uris: list):
+        """
+        Pull Docker images, overlapping the downloads.
+
+        NIM images are multi-GB, so sequential pulls leave the network
+        idle between images. The fan-out is capped by the
+        COMPOSE_PARALLEL_LIMIT environment variable (default 5) and
+        per-layer progress output is discarded.
+        """
+        image_uris = list(dict.fromkeys(image_uris))  # Dedupe, keep order
+        if not image_uris:
+            return
+
+        def _pull_one(image_uri):
+            logger.info(f"Pulling Docker image: {image_uri}")
+            try:
+                subprocess.run(
+                    ["docker", "pull", image_uri],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+                logger.info(f"Successfully pulled image: {image_uri}")
+            except subprocess.CalledProcessError as e:
+                logger.error(f"Failed to pull image: {e}")
+                raise Exception(f"Failed to pull Docker image: {image_uri}")
+
+        if len(image_uris) == 1:
+            _pull_one(image_uris[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(_PULL_LIMIT, len(image_uris))) as executor:
+            for future in [executor.submit(_pull_one, uri) for uri in image_uris]:
+                future.result()
     
+    def _load_compose(self) -> Dict:
+        """
+        Parsed docker-compose.yml, served from cache while the file is
+        unchanged on disk.
+
+        Every endpoint/list call used to re-open and re-tokenize the
+        whole file - O(services) per call, so a deploy+list cycle was
+        quadratic in the number of services. The parse now happens once
+        per on-disk change, keyed by st_mtime_ns.
+        """
+        if not self.docker_compose_path.exists():
+            return {}
+        mtime = self.docker_compose_path.stat().st_mtime_ns
+        if self._compose_cache is not None and mtime == self._compose_mtime:
+            return self._compose_cache
+        with open(self.docker_compose_path, 'r') as f:
+            compose_data = yaml.load(f, Loader=_YAML_LOADER) or {}
+        self._compose_cache = compose_data
+        self._compose_mtime = mtime
+        return compose_data
+
     def _update_docker_compose(self, node_type: str, instance_name: str, image_uri: str):
         """Create or update docker-compose.yml with new service"""
         # Read existing docker-compose.yml if it exists
         services = {}
         if self.docker_compose_path.exists():
             try:
-                import yaml
-                with open(self.docker_compose_path, 'r') as f:
-                    compose_data = yaml.safe_load(f) or {}
-                    services = compose_data.get('services', {})
+                services = self._load_compose().get('services', {})
             except Exception as e:
                 logger.warning(f"Failed to read existing docker-compose.yml: {e}")
         
@@ -166,15 +281,18 @@ class LocalDeployer:
         
         # Write docker-compose.yml
         try:
-            import yaml
             compose_data = {
                 'version': '3.8',
                 'services': services
             }
             
             with open(self.docker_compose_path, 'w') as f:
-                yaml.dump(compose_data, f, default_flow_style=False)
-            
+                yaml.dump(compose_data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+
+            # What was just written is the current parse - no re-read needed
+            self._compose_cache = compose_data
+            self._compose_mtime = self.docker_compose_path.stat().st_mtime_ns
+
             logger.info(f"Updated docker-compose.yml with service: {instance_name}")
         except Exception as e:
             logger.error(f"Failed to write docker-compose.yml: {e}")
@@ -199,16 +317,13 @@ class LocalDeployer:
         """Get endpoint URL for deployed NIM instance"""
         # Read docker-compose.yml to get port
         try:
-            import yaml
-            with open(self.docker_compose_path, 'r') as f:
-                compose_data = yaml.safe_load(f)
-                service_config = compose_data.get('services', {}).get(instance_name, {})
-                ports = service_config.get('ports', [])
-                if ports:
-                    port_mapping = ports[0]
-                    if ':' in str(port_mapping):
-                        host_port = int(str(port_mapping).split(':')[0])
-                        return f"http://localhost:{host_port}"
+            service_config = self._load_compose().get('services', {}).get(instance_name, {})
+            ports = service_config.get('ports', [])
+            if ports:
+                port_mapping = ports[0]
+                if ':' in str(port_mapping):
+                    host_port = int(str(port_mapping).split(':')[0])
+                    return f"http://localhost:{host_port}"
         except Exception:
             pass
         
@@ -249,25 +364,21 @@ class LocalDeployer:
         deployments = []
         
         try:
-            import yaml
-            if self.docker_compose_path.exists():
-                with open(self.docker_compose_path, 'r') as f:
-                    compose_data = yaml.safe_load(f) or {}
-                    services = compose_data.get('services', {})
-                    
-                    for service_name, service_config in services.items():
-                        if 'nim-' in service_name.lower():
-                            endpoint = self._get_endpoint_url(service_name)
-                            status = self.get_deployment_status(service_name)
-                            
-                            deployments.append({
-                                'instance_name': service_name,
-                                'status': status.get('status', 'unknown'),
-                                'runningCount': status.get('runningCount', 0),
-                                'endpoint': endpoint,
-                                'provider': 'local',
-                                'region': 'localhost'
-                            })
+            services = self._load_compose().get('services', {})
+
+            for service_name, service_config in services.items():
+                if 'nim-' in service_name.lower():
+                    endpoint = self._get_endpoint_url(service_name)
+                    status = self.get_deployment_status(service_name)
+
+                    deployments.append({
+                        'instance_name': service_name,
+                        'status': status.get('status', 'unknown'),
+                        'runningCount': status.get('runningCount', 0),
+                        'endpoint': endpoint,
+                        'provider': 'local',
+                        'region': 'localhost'
+                    })
         except Exception as e:
             logger.error(f"Error listing deployments: {e}", exc_info=True)
         
@@ -15,7 +15,9 @@ setup(
         "boto3>=1.28.0",
         "azure-identity>=1.14.0",
         "azure-mgmt-containerinstance>=10.0.0",
-        "azure-mgmt-containerservice>=27.0.0",
+        "azure-mgmt-containerservice>=30.0.0",
+        "azure-mgmt-resource>=23.0.0",
+        "kubernetes>=28.1.0",
         "google-cloud-compute>=1.14.0",
         "google-cloud-container>=2.21.0",
         "google-cloud-billing>=1.11.0",